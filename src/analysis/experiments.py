@@ -4,13 +4,22 @@ Maps hypotheses to concrete, timeboxed experiments.
 """
 
 import logging
+import re
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Optional
 
 from src.core.models import ExperimentSuggestion, Hypothesis
 
 logger = logging.getLogger(__name__)
 
+# Title keywords that select an experiment type. The lookahead also reports
+# overlapping matches, so this behaves like a set of substring checks.
+_TITLE_KEYWORDS = re.compile(
+    r"(?=(review|bottleneck|sizing|slicing|quality|defect|testing"
+    r"|morale|happiness|engagement|workflow|efficiency))"
+)
+
 
 @dataclass
 class ExperimentTemplate:
@@ -28,9 +37,10 @@ class ExperimentTemplate:
 class ExperimentGenerator:
     """Generate actionable experiments from hypotheses."""
 
-    def __init__(self):
-        """Initialize experiment generator with templates."""
-        self.templates = self._initialize_templates()
+    @cached_property
+    def templates(self) -> List[ExperimentTemplate]:
+        """Experiment templates, built on first access."""
+        return self._initialize_templates()
 
     def generate_experiments(
         self, hypotheses: List[Hypothesis], max_experiments: int = 3
@@ -64,36 +74,28 @@ class ExperimentGenerator:
         self, hypothesis: Hypothesis, hypothesis_index: int
     ) -> Optional[ExperimentSuggestion]:
         """Generate experiment for a specific hypothesis."""
-        title_lower = hypothesis.title.lower()
+        keywords = set(_TITLE_KEYWORDS.findall(hypothesis.title.lower()))
 
         # Review bottleneck experiments
-        if "review" in title_lower and "bottleneck" in title_lower:
+        if {"review", "bottleneck"} <= keywords:
             return self._create_review_bottleneck_experiment(
                 hypothesis, hypothesis_index
             )
 
         # Story sizing experiments
-        if "sizing" in title_lower or "slicing" in title_lower:
+        if keywords & {"sizing", "slicing"}:
             return self._create_story_sizing_experiment(hypothesis, hypothesis_index)
 
         # Quality/defect experiments
-        if (
-            "quality" in title_lower
-            or "defect" in title_lower
-            or "testing" in title_lower
-        ):
+        if keywords & {"quality", "defect", "testing"}:
             return self._create_quality_experiment(hypothesis, hypothesis_index)
 
         # Team morale experiments
-        if (
-            "morale" in title_lower
-            or "happiness" in title_lower
-            or "engagement" in title_lower
-        ):
+        if keywords & {"morale", "happiness", "engagement"}:
             return self._create_morale_experiment(hypothesis, hypothesis_index)
 
         # Workflow efficiency experiments
-        if "workflow" in title_lower or "efficiency" in title_lower:
+        if keywords & {"workflow", "efficiency"}:
             return self._create_workflow_experiment(hypothesis, hypothesis_index)
 
         # Generic experiment
@@ -311,6 +313,13 @@ class ExperimentGenerator:
         ]
 
 
+# Global generator instance
+_experiment_generator_instance: Optional[ExperimentGenerator] = None
+
+
 def get_experiment_generator() -> ExperimentGenerator:
-    """Get experiment generator instance."""
-    return ExperimentGenerator()
+    """Get global experiment generator instance."""
+    global _experiment_generator_instance
+    if _experiment_generator_instance is None:
+        _experiment_generator_instance = ExperimentGenerator()
+    return _experiment_generator_instance
@@ -5,7 +5,7 @@ Uses rule-based templates and statistical evidence to generate hypotheses.
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Union
 
 from src.core.config import settings
 from src.core.models import (
@@ -18,6 +18,19 @@ from src.core.models import (
 
 logger = logging.getLogger(__name__)
 
+# Trends/correlations as given, or pre-indexed by generate_hypotheses
+TrendLookup = Union[List[TrendAnalysis], Dict[str, TrendAnalysis]]
+CorrelationLookup = Union[
+    List[CorrelationResult], Dict[FrozenSet[str], CorrelationResult]
+]
+
+# Workflow phases checked for simultaneous slowdown, with their time metric
+_WORKFLOW_PHASES = (
+    ("coding", "coding_time"),
+    ("review", "review_time"),
+    ("testing", "testing_time"),
+)
+
 
 @dataclass
 class HypothesisTemplate:
@@ -59,6 +72,10 @@ class HypothesisGenerator:
         """
         logger.info("Generating hypotheses from analysis results")
 
+        # Index once so each check does O(1) lookups instead of list scans
+        trends = self._index_trends(trends)
+        correlations = self._index_correlations(correlations)
+
         hypotheses = []
 
         # Check for review bottleneck patterns
@@ -101,7 +118,7 @@ class HypothesisGenerator:
         return top_hypotheses
 
     def _check_review_bottleneck(
-        self, trends: List[TrendAnalysis], correlations: List[CorrelationResult]
+        self, trends: TrendLookup, correlations: CorrelationLookup
     ) -> Optional[Hypothesis]:
         """Check for review process bottleneck."""
         # Find review time trend
@@ -173,7 +190,7 @@ class HypothesisGenerator:
         )
 
     def _check_story_sizing_issues(
-        self, trends: List[TrendAnalysis], sprints: List[SprintMetrics]
+        self, trends: TrendLookup, sprints: List[SprintMetrics]
     ) -> Optional[Hypothesis]:
         """Check for story sizing/slicing issues."""
         items_out_trend = self._find_trend(trends, "items_out_of_sprint_percent")
@@ -235,7 +252,7 @@ class HypothesisGenerator:
         )
 
     def _check_quality_issues(
-        self, trends: List[TrendAnalysis], correlations: List[CorrelationResult]
+        self, trends: TrendLookup, correlations: CorrelationLookup
     ) -> Optional[Hypothesis]:
         """Check for quality and defect patterns."""
         defect_trend = self._find_trend(trends, "defect_rate_production")
@@ -289,7 +306,7 @@ class HypothesisGenerator:
         )
 
     def _check_team_morale(
-        self, trends: List[TrendAnalysis], correlations: List[CorrelationResult]
+        self, trends: TrendLookup, correlations: CorrelationLookup
     ) -> Optional[Hypothesis]:
         """Check for team morale and happiness issues."""
         happiness_trend = self._find_trend(trends, "team_happiness")
@@ -359,33 +376,15 @@ class HypothesisGenerator:
         )
 
     def _check_workflow_efficiency(
-        self, trends: List[TrendAnalysis], correlations: List[CorrelationResult]
+        self, trends: TrendLookup, correlations: CorrelationLookup
     ) -> Optional[Hypothesis]:
         """Check for overall workflow efficiency issues."""
-        coding_trend = self._find_trend(trends, "coding_time")
-        review_trend = self._find_trend(trends, "review_time")
-        testing_trend = self._find_trend(trends, "testing_time")
-
         # All phases increasing suggests workflow inefficiency
         increasing_phases = []
-        if (
-            coding_trend
-            and coding_trend.trend_direction == "up"
-            and coding_trend.is_significant
-        ):
-            increasing_phases.append(("coding", coding_trend))
-        if (
-            review_trend
-            and review_trend.trend_direction == "up"
-            and review_trend.is_significant
-        ):
-            increasing_phases.append(("review", review_trend))
-        if (
-            testing_trend
-            and testing_trend.trend_direction == "up"
-            and testing_trend.is_significant
-        ):
-            increasing_phases.append(("testing", testing_trend))
+        for phase_name, metric_name in _WORKFLOW_PHASES:
+            trend = self._find_trend(trends, metric_name)
+            if trend and trend.trend_direction == "up" and trend.is_significant:
+                increasing_phases.append((phase_name, trend))
 
         if len(increasing_phases) < 2:
             return None
@@ -425,7 +424,7 @@ class HypothesisGenerator:
         )
 
     def _check_defect_patterns(
-        self, trends: List[TrendAnalysis], sprints: List[SprintMetrics]
+        self, trends: TrendLookup, sprints: List[SprintMetrics]
     ) -> Optional[Hypothesis]:
         """Check for specific defect patterns by environment or root cause."""
         # Look at recent sprint for defect distribution
@@ -494,16 +493,40 @@ class HypothesisGenerator:
 
         return None
 
+    def _index_trends(self, trends: TrendLookup) -> Dict[str, TrendAnalysis]:
+        """Index trends by metric name, keeping the first trend per metric."""
+        if isinstance(trends, dict):
+            return trends
+        index: Dict[str, TrendAnalysis] = {}
+        for trend in trends:
+            index.setdefault(trend.metric_name, trend)
+        return index
+
+    def _index_correlations(
+        self, correlations: CorrelationLookup
+    ) -> Dict[FrozenSet[str], CorrelationResult]:
+        """Index correlations by unordered metric pair, keeping the first."""
+        if isinstance(correlations, dict):
+            return correlations
+        index: Dict[FrozenSet[str], CorrelationResult] = {}
+        for corr in correlations:
+            index.setdefault(frozenset((corr.metric_1, corr.metric_2)), corr)
+        return index
+
     def _find_trend(
-        self, trends: List[TrendAnalysis], metric_name: str
+        self, trends: TrendLookup, metric_name: str
     ) -> Optional[TrendAnalysis]:
         """Find trend for specific metric."""
+        if isinstance(trends, dict):
+            return trends.get(metric_name)
         return next((t for t in trends if t.metric_name == metric_name), None)
 
     def _find_correlation(
-        self, correlations: List[CorrelationResult], metric1: str, metric2: str
+        self, correlations: CorrelationLookup, metric1: str, metric2: str
     ) -> Optional[CorrelationResult]:
         """Find correlation between two metrics."""
+        if isinstance(correlations, dict):
+            return correlations.get(frozenset((metric1, metric2)))
         return next(
             (
                 c
@@ -529,6 +552,13 @@ class HypothesisGenerator:
         return []
 
 
+# Global generator instance
+_hypothesis_generator_instance: Optional[HypothesisGenerator] = None
+
+
 def get_hypothesis_generator() -> HypothesisGenerator:
-    """Get hypothesis generator instance."""
-    return HypothesisGenerator()
+    """Get global hypothesis generator instance."""
+    global _hypothesis_generator_instance
+    if _hypothesis_generator_instance is None:
+        _hypothesis_generator_instance = HypothesisGenerator()
+    return _hypothesis_generator_instance
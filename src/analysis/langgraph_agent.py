@@ -2,7 +2,9 @@
 LangGraph-based AI agent for intelligent dashboard data analysis and insights.
 """
 
+import json
 import logging
+import re
 from typing import Any, TypedDict, Annotated
 import operator
 
@@ -15,6 +17,20 @@ from src.utils.dashboard_client import DashboardClient, get_dashboard_client
 
 logger = logging.getLogger(__name__)
 
+# A flat JSON array of plain strings, the shape the LLM is asked to return
+_JSON_WS = r"[ \t\n\r]*"
+_JSON_STR = r'"[^"\\\x00-\x1f]*"'
+_JSON_ITEMS = rf"{_JSON_STR}{_JSON_WS}(?:,{_JSON_WS}{_JSON_STR}{_JSON_WS})*"
+_CHART_LIST_RE = re.compile(rf"{_JSON_WS}\[{_JSON_WS}(?:{_JSON_ITEMS})?\]{_JSON_WS}")
+_CHART_NAME_RE = re.compile(r'"([^"]*)"')
+
+
+def _parse_chart_names(content: str) -> Any:
+    """Parse the LLM's chart list, skipping the JSON parser for flat string arrays."""
+    if _CHART_LIST_RE.fullmatch(content):
+        return _CHART_NAME_RE.findall(content)
+    return json.loads(content)
+
 
 class AgentState(TypedDict):
     """State for the LangGraph agent."""
@@ -124,9 +140,7 @@ class DashboardAnalysisAgent:
 
         # Parse the response to get chart names
         try:
-            import json
-
-            chart_names = json.loads(response.content)
+            chart_names = _parse_chart_names(response.content)
             state["analysis_results"] = {"relevant_charts": chart_names}
         except Exception as e:
             logger.error(f"Failed to parse chart names: {e}")
@@ -4,31 +4,159 @@ Performs trend analysis, correlation analysis, and pattern recognition.
 """
 
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+import math
+import operator
+import typing
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
 from scipy import stats
 
 from src.core.config import settings
 from src.core.models import CorrelationResult, SprintMetrics, TrendAnalysis
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class TrendResult:
-    """Internal result of trend calculation."""
+def _is_numeric_annotation(annotation: Any) -> bool:
+    """Whether a field annotation is int or float, optionally wrapped in Optional."""
+    return any(
+        arg in (int, float) for arg in typing.get_args(annotation) or (annotation,)
+    )
+
+
+# Numeric SprintMetrics fields, in declaration order
+_NUMERIC_METRIC_FIELDS: Tuple[str, ...] = tuple(
+    name
+    for name, field in SprintMetrics.model_fields.items()
+    if _is_numeric_annotation(field.annotation)
+)
 
-    metric_name: str
-    values: List[float]
-    current_value: Optional[float]
-    previous_value: Optional[float]
-    change_percent: Optional[float]
-    mean: float
-    std: float
-    z_score: Optional[float]
+# Labels indexed by the codes computed in _calculate_trends
+_TREND_DIRECTIONS = ("down", "stable", "up")
+_SIGNIFICANCE_LEVELS = (None, "p < 0.05", "p < 0.01")
+
+# Correlation interpretation text by (strength, direction, p < 0.05),
+# leaving only r to be filled in
+_CORRELATION_INTERPRETATIONS = {
+    (strength, direction, significant): (
+        f"{strength.capitalize()} {direction} correlation (r={{:.2f}})"
+        + (" (statistically significant)" if significant else "")
+    )
+    for strength in ("weak", "moderate", "strong")
+    for direction in ("positive", "negative")
+    for significant in (False, True)
+}
+
+# Slack for rounding differences between the screening matrix and pearsonr
+_SCREEN_TOLERANCE = 1e-9
+
+
+def _zscore_outliers_loop(
+    values: np.ndarray, z_threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Positions and z-scores of values at least z_threshold sample std devs
+    from the mean; empty when the values are constant.
+
+    Written as plain loops so numba can compile it into one kernel. The mean
+    and variance come from a single Welford pass, which stays accurate for
+    large values with a small spread.
+    """
+    n = values.shape[0]
+    mean = 0.0
+    squares = 0.0
+    for i in range(n):
+        delta = values[i] - mean
+        mean += delta / (i + 1)
+        squares += delta * (values[i] - mean)
+    std = math.sqrt(squares / (n - 1))
+
+    positions = np.empty(n, dtype=np.int64)
+    z_scores = np.empty(n, dtype=np.float64)
+    count = 0
+    if std == 0:
+        return positions[:count], z_scores[:count]
+
+    for i in range(n):
+        z_score = (values[i] - mean) / std
+        if abs(z_score) >= z_threshold:
+            positions[count] = i
+            z_scores[count] = z_score
+            count += 1
+    return positions[:count], z_scores[:count]
+
+
+def _zscore_outliers_numpy(
+    values: np.ndarray, z_threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """NumPy equivalent of _zscore_outliers_loop."""
+    std = values.std(ddof=1)
+    if std == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    z_scores = (values - values.mean()) / std
+    positions = np.flatnonzero(np.abs(z_scores) >= z_threshold)
+    return positions, z_scores[positions]
+
+
+if njit is not None:
+    _zscore_outliers = njit(cache=True)(_zscore_outliers_loop)
+else:
+    _zscore_outliers = _zscore_outliers_numpy
+
+
+def _column_stats(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Per-column statistics of a dense (sprints x metrics) array.
+
+    One centring pass gives each column's deviations from its mean, their
+    norm, whether the column is constant, and its Pearson r with the sprint
+    index (NaN for constant columns). The trend test and the correlation
+    screen are both built from these.
+    """
+    centered = values - values.mean(axis=0)
+    norms = np.sqrt(np.einsum("ij,ij->j", centered, centered))
+    constant = (values == values[:1]).all(axis=0)
+
+    time = np.arange(len(values)) - (len(values) - 1) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_time = (time @ centered) / (np.linalg.norm(time) * norms)
+    r_time = np.where(constant, np.nan, np.clip(r_time, -1.0, 1.0))
+
+    return {
+        "centered": centered,
+        "norms": norms,
+        "constant": constant,
+        "r_time": r_time,
+    }
+
+
+def _pearson_p_values(r: np.ndarray, n: int) -> np.ndarray:
+    """Two-sided p-values of Pearson coefficients from n pairs, as pearsonr."""
+    shape = n / 2 - 1
+    return 2 * stats.beta.sf(np.abs(r), shape, shape, loc=-1, scale=2)
+
+
+def _datetime_column(values: List[Any]) -> Any:
+    """
+    Convert dates to a datetime64[ns] column.
+
+    Naive datetimes are converted by NumPy in one call; anything else (such
+    as timezone-aware datetimes, which NumPy cannot represent) goes through
+    pd.to_datetime.
+    """
+    if all(isinstance(value, datetime) and value.tzinfo is None for value in values):
+        return np.array(values, dtype="datetime64[ns]")
+    return pd.to_datetime(values)
 
 
 class StatisticalAnalyzer:
@@ -71,83 +199,91 @@ class StatisticalAnalyzer:
             logger.warning("Need at least 2 sprints for trend analysis")
             return []
 
-        # Convert to DataFrame for easier manipulation
-        df = self._sprints_to_dataframe(sprints)
+        fields = type(sprints[0]).model_fields
 
         if metrics_to_analyze is None:
             # Analyze all numeric metrics
-            metrics_to_analyze = self._get_numeric_metrics(df)
-
-        trends = []
-        for metric in metrics_to_analyze:
-            if metric not in df.columns:
-                continue
+            metrics_to_analyze = self._get_numeric_metrics(fields)
 
-            trend = self._calculate_trend(df, metric)
-            if trend:
-                trends.append(trend)
+        metrics = [metric for metric in metrics_to_analyze if metric in fields]
+        unique_metrics = list(dict.fromkeys(metrics))
+        computed = self._calculate_trends(
+            self._to_soa(sprints, unique_metrics), unique_metrics
+        )
+        trends = [computed[metric] for metric in metrics if metric in computed]
 
         logger.info(f"Analyzed trends for {len(trends)} metrics")
         return trends
 
-    def _calculate_trend(
-        self, df: pd.DataFrame, metric_name: str
-    ) -> Optional[TrendAnalysis]:
-        """Calculate trend for a single metric."""
-        values = df[metric_name].dropna()
-
-        if len(values) < 2:
-            return None
-
-        current_value = float(values.iloc[-1])
-        previous_value = float(values.iloc[-2])
-
-        # Calculate percentage change
-        if previous_value != 0:
-            change_percent = ((current_value - previous_value) / previous_value) * 100
-        else:
-            change_percent = 0.0
-
-        # Determine trend direction
-        if abs(change_percent) < 1.0:  # Less than 1% change
-            trend_direction = "stable"
-        elif change_percent > 0:
-            trend_direction = "up"
-        else:
-            trend_direction = "down"
-
-        # Check if change is significant (exceeds threshold)
-        is_significant = abs(change_percent / 100) >= self.trend_threshold
-
-        # Calculate z-score for anomaly detection
-        mean_val = float(values.mean())
-        std_val = float(values.std())
-        z_score = None
+    def _calculate_trends(
+        self, columns: Dict[str, np.ndarray], metrics: List[str]
+    ) -> Dict[str, TrendAnalysis]:
+        """
+        Calculate trends for several metrics at once.
 
-        if std_val > 0:
-            z_score = (current_value - mean_val) / std_val
+        Metrics are grouped by their number of non-null values so each group
+        is a dense (metrics x sprints) array; change, direction and the
+        correlation-with-time test then run as whole-array operations.
+        Metrics with fewer than 2 values are left out.
+        """
+        if not metrics:
+            return {}
+
+        values = np.array([columns[metric] for metric in metrics], dtype=np.float64)
+        valid = ~np.isnan(values)
+        counts = valid.sum(axis=1)
+
+        trends = {}
+        for count in np.unique(counts[counts >= 2]):
+            rows = np.flatnonzero(counts == count)
+            # Non-null values of each metric, oldest first
+            series = values[rows][valid[rows]].reshape(len(rows), count)
+            current = series[:, -1]
+            previous = series[:, -2]
+
+            # Calculate percentage change (0 when the previous value is 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                change = np.where(
+                    previous != 0, ((current - previous) / previous) * 100, 0.0
+                )
+
+            # Direction code: 0 down, 1 stable (less than 1% change), 2 up
+            directions = (
+                np.where(np.abs(change) < 1.0, 0, np.sign(change)).astype(np.intp) + 1
+            )
+
+            # Check if change is significant (exceeds threshold)
+            significant = np.abs(change / 100) >= self.trend_threshold
 
-        # Determine statistical significance if applicable
-        significance_level = None
-        if len(values) >= 3:
             # Simple trend test using correlation with time
-            time_series = np.arange(len(values))
-            correlation, p_value = stats.pearsonr(time_series, values)
-
-            if p_value < 0.01:
-                significance_level = "p < 0.01"
-            elif p_value < 0.05:
-                significance_level = "p < 0.05"
-
-        return TrendAnalysis(
-            metric_name=metric_name,
-            current_value=current_value,
-            previous_value=previous_value,
-            change_percent=round(change_percent, 2),
-            trend_direction=trend_direction,
-            is_significant=is_significant,
-            significance_level=significance_level,
-        )
+            p_values = np.full(len(rows), np.nan)
+            if count >= 3:
+                r_time = _column_stats(series.T)["r_time"]
+                p_values = _pearson_p_values(r_time, count)
+            levels = (p_values < 0.05).astype(np.intp) + (p_values < 0.01)
+
+            for row, cur, prev, pct, direction, is_significant, level in zip(
+                rows,
+                current.tolist(),
+                previous.tolist(),
+                change.tolist(),
+                directions.tolist(),
+                significant.tolist(),
+                levels.tolist(),
+            ):
+                # Every value is already a plain str/float/bool of the right
+                # type, so skip re-validating each field
+                trends[metrics[row]] = TrendAnalysis.model_construct(
+                    metric_name=metrics[row],
+                    current_value=cur,
+                    previous_value=prev,
+                    change_percent=round(pct, 2),
+                    trend_direction=_TREND_DIRECTIONS[direction],
+                    is_significant=is_significant,
+                    significance_level=_SIGNIFICANCE_LEVELS[level],
+                )
+
+        return trends
 
     def analyze_correlations(
         self,
@@ -168,23 +304,30 @@ class StatisticalAnalyzer:
             logger.warning("Need at least 3 sprints for correlation analysis")
             return []
 
-        df = self._sprints_to_dataframe(sprints)
+        fields = type(sprints[0]).model_fields
 
         if metrics_to_analyze is None:
-            metrics_to_analyze = self._get_numeric_metrics(df)
+            metrics_to_analyze = self._get_numeric_metrics(fields)
 
-        # Calculate correlation matrix
-        correlations = []
+        metrics = [metric for metric in metrics_to_analyze if metric in fields]
+        columns = self._to_soa(sprints, metrics)
+        index, maybe_strong = self._screen_correlations(columns, metrics)
 
-        for i, metric1 in enumerate(metrics_to_analyze):
-            if metric1 not in df.columns:
-                continue
+        correlations = []
 
-            for metric2 in metrics_to_analyze[i + 1 :]:
-                if metric2 not in df.columns:
+        for i, metric1 in enumerate(metrics):
+            for metric2 in metrics[i + 1 :]:
+                # Skip pairs the correlation matrix already rules out
+                pos1, pos2 = index.get(metric1), index.get(metric2)
+                if (
+                    pos1 is not None
+                    and pos2 is not None
+                    and pos1 != pos2
+                    and not maybe_strong[pos1, pos2]
+                ):
                     continue
 
-                corr_result = self._calculate_correlation(df, metric1, metric2)
+                corr_result = self._calculate_correlation(columns, metric1, metric2)
                 if corr_result and corr_result.is_strong:
                     correlations.append(corr_result)
 
@@ -194,22 +337,58 @@ class StatisticalAnalyzer:
         logger.info(f"Found {len(correlations)} strong correlations")
         return correlations
 
+    def _screen_correlations(
+        self, columns: Dict[str, np.ndarray], metrics: List[str]
+    ) -> Tuple[Dict[str, int], np.ndarray]:
+        """
+        Correlate all fully populated numeric metrics with one matrix product.
+
+        Returns each screened metric's position and a boolean matrix marking
+        pairs that may reach the correlation threshold. Constant metrics never
+        correlate. Pairs involving other metrics are not screened.
+        """
+        screened = [
+            metric
+            for metric in dict.fromkeys(metrics)
+            if not np.isnan(columns[metric]).any()
+        ]
+        if not screened:
+            return {}, np.zeros((0, 0), dtype=bool)
+
+        values = np.column_stack([columns[metric] for metric in screened])
+
+        # Constant metrics correlate with nothing, so leave them out of the
+        # product; the rest are centred and scaled to unit length so that
+        # X.T @ X is Pearson's r
+        column_stats = _column_stats(values)
+        live = np.flatnonzero(~column_stats["constant"])
+        unit = column_stats["centered"][:, live] / column_stats["norms"][live]
+        coefficients = unit.T @ unit
+
+        maybe_strong = np.zeros((len(screened), len(screened)), dtype=bool)
+        maybe_strong[np.ix_(live, live)] = (
+            np.abs(coefficients) >= self.correlation_threshold - _SCREEN_TOLERANCE
+        )
+        return {metric: i for i, metric in enumerate(screened)}, maybe_strong
+
     def _calculate_correlation(
-        self, df: pd.DataFrame, metric1: str, metric2: str
+        self, columns: Dict[str, np.ndarray], metric1: str, metric2: str
     ) -> Optional[CorrelationResult]:
         """Calculate correlation between two metrics."""
-        # Get non-null values for both metrics
-        data = df[[metric1, metric2]].dropna()
+        # Get sprints with values for both metrics
+        values1, values2 = columns[metric1], columns[metric2]
+        present = ~(np.isnan(values1) | np.isnan(values2))
+        values1, values2 = values1[present], values2[present]
 
-        if len(data) < 3:
+        if len(values1) < 3:
             return None
 
         # Check for constant arrays (no variance)
-        if data[metric1].std() == 0 or data[metric2].std() == 0:
+        if values1.std(ddof=1) == 0 or values2.std(ddof=1) == 0:
             return None
 
         # Calculate Pearson correlation
-        correlation, p_value = stats.pearsonr(data[metric1], data[metric2])
+        correlation, p_value = stats.pearsonr(values1, values2)
 
         # Check for NaN (shouldn't happen after std check, but be safe)
         if np.isnan(correlation):
@@ -228,12 +407,9 @@ class StatisticalAnalyzer:
 
         direction = "positive" if correlation > 0 else "negative"
 
-        interpretation = (
-            f"{strength.capitalize()} {direction} correlation (r={correlation:.2f})"
-        )
-
-        if p_value < 0.05:
-            interpretation += " (statistically significant)"
+        interpretation = _CORRELATION_INTERPRETATIONS[
+            strength, direction, bool(p_value < 0.05)
+        ].format(correlation)
 
         return CorrelationResult(
             metric_1=metric1,
@@ -257,29 +433,23 @@ class StatisticalAnalyzer:
         Returns:
             List of tuples (sprint_index, value, z_score) for anomalies
         """
-        df = self._sprints_to_dataframe(sprints)
+        columns = self._to_soa(sprints, [metric_name])
 
-        if metric_name not in df.columns:
+        if metric_name not in columns:
             return []
 
-        values = df[metric_name].dropna()
+        values = columns[metric_name]
+        values = values[~np.isnan(values)]
 
         if len(values) < 3:
             return []
 
-        mean = values.mean()
-        std = values.std()
-
-        if std == 0:
-            return []
-
-        anomalies = []
-        for idx, value in enumerate(values):
-            z_score = (value - mean) / std
-            if abs(z_score) >= z_threshold:
-                anomalies.append((idx, float(value), float(z_score)))
+        positions, z_scores = _zscore_outliers(values, float(z_threshold))
 
-        return anomalies
+        return [
+            (int(i), float(values[i]), float(z_score))
+            for i, z_score in zip(positions, z_scores)
+        ]
 
     def calculate_moving_average(
         self, sprints: List[SprintMetrics], metric_name: str, window: int = 3
@@ -295,15 +465,30 @@ class StatisticalAnalyzer:
         Returns:
             List of moving average values
         """
-        df = self._sprints_to_dataframe(sprints)
+        columns = self._to_soa(sprints, [metric_name])
 
-        if metric_name not in df.columns:
+        if metric_name not in columns:
             return []
 
-        values = df[metric_name]
-        ma = values.rolling(window=window, min_periods=1).mean()
+        try:
+            window = operator.index(window)
+        except TypeError:
+            raise ValueError(
+                f"window must be a positive integer, got {window!r}"
+            ) from None
+        if window < 1:
+            raise ValueError(f"window must be a positive integer, got {window!r}")
+
+        # Pad the front so the first values average over partial windows
+        values = columns[metric_name]
+        padded = np.concatenate((np.full(window - 1, np.nan), values))
+        windows = sliding_window_view(padded, window)
+
+        counts = np.count_nonzero(~np.isnan(windows), axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ma = np.nansum(windows, axis=1) / counts
 
-        return [float(v) if pd.notna(v) else None for v in ma]
+        return [float(v) if count else None for v, count in zip(ma, counts)]
 
     def analyze_story_point_distribution(
         self, sprints: List[SprintMetrics]
@@ -326,14 +511,20 @@ class StatisticalAnalyzer:
         if not distributions:
             return {"pattern": "No distribution data available"}
 
-        # Aggregate across all sprints
-        total_counts = {}
-        for dist in distributions:
-            for size, count in dist.items():
-                total_counts[size] = total_counts.get(size, 0) + count
+        # Aggregate across all sprints: one (sprints x sizes) count matrix
+        sizes = list(dict.fromkeys(size for dist in distributions for size in dist))
+        counts = np.fromiter(
+            (dist.get(size, 0) for dist in distributions for size in sizes),
+            dtype=np.int64,
+            count=len(distributions) * len(sizes),
+        ).reshape(len(distributions), len(sizes))
+        size_totals = counts.sum(axis=0)
+
+        total = int(size_totals.sum())
+        if total == 0:
+            return {"pattern": "No distribution data available"}
 
-        total = sum(total_counts.values())
-        percentages = {k: (v / total) * 100 for k, v in total_counts.items()}
+        percentages = dict(zip(sizes, (size_totals / total * 100).tolist()))
 
         # Identify patterns
         large_percent = percentages.get("large", 0)
@@ -353,34 +544,55 @@ class StatisticalAnalyzer:
         }
 
     def _sprints_to_dataframe(self, sprints: List[SprintMetrics]) -> pd.DataFrame:
-        """Convert list of SprintMetrics to pandas DataFrame."""
-        data = []
-        for sprint in sprints:
-            data.append(sprint.model_dump())
-
-        df = pd.DataFrame(data)
-
-        # Convert datetime columns
-        if "start_date" in df.columns:
-            df["start_date"] = pd.to_datetime(df["start_date"])
-        if "end_date" in df.columns:
-            df["end_date"] = pd.to_datetime(df["end_date"])
-
-        return df
-
-    def _get_numeric_metrics(self, df: pd.DataFrame) -> List[str]:
-        """Get list of numeric metric column names."""
-        # Exclude non-metric columns
-        exclude = [
-            "sprint_id",
-            "sprint_name",
-            "start_date",
-            "end_date",
-            "story_point_distribution",
-        ]
+        """
+        Convert list of SprintMetrics to pandas DataFrame.
+
+        The analyses work on the arrays from _to_soa; this only wraps them
+        (plus the non-numeric fields) in a frame for callers that want one.
+        """
+        if not sprints:
+            return pd.DataFrame()
+
+        fields = type(sprints[0]).model_fields
+        numeric = self._to_soa(sprints, self._get_numeric_metrics(fields))
+
+        columns = {}
+        for name in fields:
+            if name in numeric:
+                columns[name] = numeric[name]
+                continue
+            values = [getattr(sprint, name) for sprint in sprints]
+            if name in ("start_date", "end_date"):
+                values = _datetime_column(values)
+            columns[name] = values
+
+        return pd.DataFrame(columns)
+
+    def _to_soa(
+        self, sprints: List[SprintMetrics], metrics: List[str]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Gather each metric across sprints into one float array (NaN if missing).
+
+        Reads the attributes directly, without building a DataFrame; metrics
+        that are not fields of the sprints are left out. Each analysis builds
+        its columns once and passes them to its helpers.
+        """
+        if not sprints:
+            return {}
+
+        fields = type(sprints[0]).model_fields
+        return {
+            metric: np.array(
+                [getattr(sprint, metric) for sprint in sprints], dtype=np.float64
+            )
+            for metric in metrics
+            if metric in fields
+        }
 
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        return [col for col in numeric_cols if col not in exclude]
+    def _get_numeric_metrics(self, columns: Iterable[str]) -> List[str]:
+        """Get list of numeric metric names among a frame's or model's columns."""
+        return [metric for metric in _NUMERIC_METRIC_FIELDS if metric in columns]
 
 
 # Global analyzer instance
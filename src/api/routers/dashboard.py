@@ -6,7 +6,6 @@ from typing import Any
 from fastapi import APIRouter, HTTPException, Query, Path
 from pydantic import BaseModel, Field
 
-from src.analysis.langgraph_agent import get_dashboard_agent
 from src.utils.dashboard_client import get_dashboard_client, ChartType
 
 logger = logging.getLogger(__name__)
@@ -149,6 +148,9 @@ async def generate_insights(request: InsightRequest):
     Raises:
         HTTPException: If insight generation fails
     """
+    # Deferred so the app starts without loading langgraph/langchain
+    from src.analysis.langgraph_agent import get_dashboard_agent
+
     try:
         agent = get_dashboard_agent()
         result = await agent.analyze(request.query)
@@ -186,6 +188,9 @@ async def chat_with_agent(message: str = Query(..., description="User's message"
     Raises:
         HTTPException: If chat fails
     """
+    # Deferred so the app starts without loading langgraph/langchain
+    from src.analysis.langgraph_agent import get_dashboard_agent
+
     try:
         agent = get_dashboard_agent()
         response = await agent.chat(message)
@@ -156,6 +156,8 @@ class ChartData(BaseModel):
     data: Dict[str, Any] = Field(description="Plotly figure JSON")
     annotations: Optional[List[str]] = None
 
+    model_config = {"defer_build": True}
+
 
 class FacilitationGuide(BaseModel):
     """Facilitation notes for retrospective meeting."""
@@ -164,6 +166,8 @@ class FacilitationGuide(BaseModel):
     agenda_15min: List[str]
     focus_areas: List[str]
 
+    model_config = {"defer_build": True}
+
 
 class RetrospectiveReport(BaseModel):
     """Complete retrospective insight report."""
@@ -263,6 +267,8 @@ class MetricsSyncRequest(BaseModel):
     )
     force_refresh: bool = Field(False, description="Force refresh even if cached")
 
+    model_config = {"defer_build": True}
+
 
 class AnalysisRequest(BaseModel):
     """Request to generate retrospective report."""
@@ -285,6 +291,8 @@ class AnalysisStatus(BaseModel):
     message: Optional[str] = None
     report_id: Optional[str] = None
 
+    model_config = {"defer_build": True}
+
 
 # ============= Async Task Models =============
 
@@ -2,11 +2,13 @@
 Client to fetch dashboard data from N8N webhooks.
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional, Literal
 from datetime import datetime, timedelta
 
 import httpx
+from pydantic_core import from_json
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +61,28 @@ class DashboardClient:
         self.timeout = timeout
         self._token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        self._token_refresh: Optional[asyncio.Future] = None
+
+    async def _http_get(
+        self,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Send a GET request to the dashboard API.
+
+        Args:
+            url: Endpoint URL
+            headers: Optional request headers
+            params: Optional query parameters
+
+        Returns:
+            HTTP response
+        """
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            return await client.get(url, headers=headers, params=params)
 
     async def _fetch_token(self) -> str:
         """
@@ -71,24 +95,23 @@ class DashboardClient:
             DashboardAPIError: If token fetch fails
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.TOKEN_URL)
-                response.raise_for_status()
+            response = await self._http_get(self.TOKEN_URL)
+            response.raise_for_status()
 
-                data = response.json()
-                token = data.get("token")
+            data = response.json()
+            token = data.get("token")
 
-                if not token:
-                    raise DashboardAPIError("No token in response")
+            if not token:
+                raise DashboardAPIError("No token in response")
 
-                # Token expires in 300 seconds (5 minutes)
-                self._token = token
-                self._token_expires_at = datetime.now() + timedelta(
-                    seconds=290
-                )  # 10s buffer
+            # Token expires in 300 seconds (5 minutes)
+            self._token = token
+            self._token_expires_at = datetime.now() + timedelta(
+                seconds=290
+            )  # 10s buffer
 
-                logger.info("Successfully fetched authentication token")
-                return token
+            logger.info("Successfully fetched authentication token")
+            return token
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching token: {e}")
@@ -120,10 +143,25 @@ class DashboardClient:
             or not self._token_expires_at
             or now >= self._token_expires_at
         ):
-            return await self._fetch_token()
+            # Share one in-flight refresh between concurrent chart requests on
+            # this loop (one left pending on a closed loop is replaced), and
+            # shield it so a cancelled caller does not cancel it for the rest
+            loop = asyncio.get_running_loop()
+            if (
+                self._token_refresh is None
+                or self._token_refresh.get_loop() is not loop
+            ):
+                self._token_refresh = loop.create_task(self._fetch_token())
+                self._token_refresh.add_done_callback(self._clear_token_refresh)
+            return await asyncio.shield(self._token_refresh)
 
         return self._token
 
+    def _clear_token_refresh(self, future: asyncio.Future) -> None:
+        """Forget a finished token refresh so the next expiry starts a new one."""
+        if self._token_refresh is future:
+            self._token_refresh = None
+
     async def fetch_chart_data(
         self, chart_name: ChartType, retry_on_auth_error: bool = True
     ) -> Dict[str, Any]:
@@ -151,24 +189,25 @@ class DashboardClient:
         params = {"name": chart_name}
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    self.DATA_URL, headers=headers, params=params
+            response = await self._http_get(
+                self.DATA_URL, headers=headers, params=params
+            )
+
+            # If unauthorized and retry is enabled, fetch new token and retry
+            if response.status_code == 401 and retry_on_auth_error:
+                logger.warning("Token expired, fetching new token and retrying")
+                self._token = None  # Force token refresh
+                return await self.fetch_chart_data(
+                    chart_name, retry_on_auth_error=False
                 )
 
-                # If unauthorized and retry is enabled, fetch new token and retry
-                if response.status_code == 401 and retry_on_auth_error:
-                    logger.warning("Token expired, fetching new token and retrying")
-                    self._token = None  # Force token refresh
-                    return await self.fetch_chart_data(
-                        chart_name, retry_on_auth_error=False
-                    )
+            response.raise_for_status()
+            # Parse in pydantic-core rather than via json.loads; response.text
+            # applies the charset httpx detects for the body
+            data = from_json(response.text)
 
-                response.raise_for_status()
-                data = response.json()
-
-                logger.info(f"Successfully fetched data for chart: {chart_name}")
-                return data
+            logger.info(f"Successfully fetched data for chart: {chart_name}")
+            return data
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
@@ -208,17 +247,7 @@ class DashboardClient:
             "happiness",
         ]
 
-        results = {}
-
-        for chart_type in chart_types:
-            try:
-                data = await self.fetch_chart_data(chart_type)
-                results[chart_type] = data
-            except Exception as e:
-                logger.error(f"Failed to fetch {chart_type}: {e}")
-                results[chart_type] = {"error": str(e)}
-
-        return results
+        return await self.fetch_multiple_charts(chart_types)
 
     async def fetch_multiple_charts(
         self, chart_names: List[ChartType]
@@ -235,15 +264,23 @@ class DashboardClient:
         Raises:
             DashboardAPIError: If any API request fails
         """
+        # Fetch charts concurrently; failures are recorded per chart
+        responses = await asyncio.gather(
+            *(self.fetch_chart_data(chart_name) for chart_name in chart_names),
+            return_exceptions=True,
+        )
+
         results = {}
 
-        for chart_name in chart_names:
-            try:
-                data = await self.fetch_chart_data(chart_name)
+        for chart_name, data in zip(chart_names, responses):
+            # Cancellation and interrupts are not chart failures
+            if isinstance(data, BaseException) and not isinstance(data, Exception):
+                raise data
+            if isinstance(data, Exception):
+                logger.error(f"Failed to fetch {chart_name}: {data}")
+                results[chart_name] = {"error": str(data)}
+            else:
                 results[chart_name] = data
-            except Exception as e:
-                logger.error(f"Failed to fetch {chart_name}: {e}")
-                results[chart_name] = {"error": str(e)}
 
         return results
 
@@ -3,8 +3,10 @@ Client to fetch team metrics from external API.
 """
 
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
@@ -20,6 +22,86 @@ class MetricsAPIError(Exception):
     pass
 
 
+# Fixed dates for mock sprint data, built once instead of parsed per call
+_MOCK_START = datetime(2024, 1, 1)
+_MOCK_END = datetime(2024, 1, 14, 23, 59, 59)
+
+# Validated sprints kept per client, least recently used evicted first
+_VALIDATED_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp (accepting a trailing Z), cached per string."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _copy_containers(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the dict and list values of a mapping, leaving other values as is."""
+    return {
+        name: value.copy()
+        for name, value in values.items()
+        if isinstance(value, (dict, list))
+    }
+
+
+def _copy_payload(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a sprint payload, including its dict and list values."""
+    return {**values, **_copy_containers(values)}
+
+
+def _copy_metrics(metrics: SprintMetrics) -> SprintMetrics:
+    """Copy validated metrics without revalidating, unsharing dict/list fields."""
+    return metrics.model_copy(update=_copy_containers(metrics.__dict__))
+
+
+def _build_mock_sprint(i: int) -> Dict[str, Any]:
+    """Build the mock data for the (i + 1)-th sprint."""
+    sprint_num = i + 1
+    month = i % 12 + 1
+    year = 2024 + i // 12
+    return {
+        "sprint_id": f"SPRINT-2024-{sprint_num:02d}",
+        "sprint_name": f"Sprint 24.{sprint_num:02d}",
+        "start_date": datetime(year, month, 1),
+        "end_date": datetime(year, month, 14, 23, 59, 59),
+        "team_happiness": 7.5 - (i * 0.2),
+        "story_points_completed": 40 + (i * 2),
+        "story_points_planned": 45,
+        "story_point_distribution": {
+            "small": 5,
+            "medium": 8 + i,
+            "large": 3,
+        },
+        "items_completed": 15 + i,
+        "items_carried_over": 2 + (i % 3),
+        "items_out_of_sprint_percent": 10.0 + (i * 2),
+        "defect_rate_production": 0.05 + (i * 0.01),
+        "defect_rate_all": 0.12 + (i * 0.02),
+        "bugs_prod": 2 + i,
+        "bugs_acc": 3 + i,
+        "bugs_test": 4,
+        "bugs_dev": 1,
+        "bugs_other": 0,
+        "open_bugs_count": 5 + (i * 2),
+        "bugs_missed_testing": 3,
+        "bugs_missed_impact": 2,
+        "bugs_requirement_gap": 1,
+        "bugs_configuration": 1,
+        "bugs_third_party": 1,
+        "bugs_database": 1,
+        "bugs_security": 0,
+        "coding_time": 100.0 + (i * 5),
+        "review_time": 20.0 + (i * 3),
+        "testing_time": 18.0 + (i * 2),
+    }
+
+
+# One year of mock sprints, built once at import; callers treat them as read-only
+_MOCK_SPRINTS_ALL = tuple(_build_mock_sprint(i) for i in range(12))
+_MOCK_SPRINTS_BY_ID = {sprint["sprint_id"]: sprint for sprint in _MOCK_SPRINTS_ALL}
+
+
 class MetricsClient:
     """Client for fetching team metrics from external API."""
 
@@ -28,6 +110,7 @@ class MetricsClient:
         api_url: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout: int = 30,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         """
         Initialize metrics client.
@@ -36,10 +119,16 @@ class MetricsClient:
             api_url: Base URL of metrics API
             api_key: API authentication key
             timeout: Request timeout in seconds
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
         """
         self.api_url = api_url or settings.external_metrics_api_url
         self.api_key = api_key or settings.external_metrics_api_key
         self.timeout = timeout
+        self.transport = transport
+        # sprint_id -> (raw payload, validated SprintMetrics), in LRU order
+        self._validated_cache: OrderedDict[
+            str, Tuple[Dict[str, Any], SprintMetrics]
+        ] = OrderedDict()
 
         if not self.api_url:
             logger.warning("Metrics API URL not configured")
@@ -71,7 +160,9 @@ class MetricsClient:
             return self._get_mock_data(count)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, transport=self.transport
+            ) as client:
                 params = {"count": count}
                 if team_id:
                     params["team_id"] = team_id
@@ -116,7 +207,9 @@ class MetricsClient:
             return self._get_mock_sprint_data(sprint_id)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, transport=self.transport
+            ) as client:
                 response = await client.get(
                     f"{self.api_url}/sprints/{sprint_id}", headers=self.headers
                 )
@@ -151,79 +244,64 @@ class MetricsClient:
 
         Raises:
             ValueError: If data validation fails
+
+        Results are cached by sprint_id (up to _VALIDATED_CACHE_SIZE sprints);
+        an identical payload returns a copy of the previously validated
+        instance, so callers never share one object.
         """
         try:
+            sprint_id = raw_data.get("sprint_id")
+            if isinstance(sprint_id, str):
+                cached = self._validated_cache.get(sprint_id)
+                if cached is not None and cached[0] == raw_data:
+                    self._validated_cache.move_to_end(sprint_id)
+                    return _copy_metrics(cached[1])
+
+            data = dict(raw_data)
+
             # Transform date strings to datetime if needed
-            if isinstance(raw_data.get("start_date"), str):
-                raw_data["start_date"] = datetime.fromisoformat(
-                    raw_data["start_date"].replace("Z", "+00:00")
-                )
+            if isinstance(data.get("start_date"), str):
+                data["start_date"] = _parse_iso(data["start_date"])
 
-            if isinstance(raw_data.get("end_date"), str):
-                raw_data["end_date"] = datetime.fromisoformat(
-                    raw_data["end_date"].replace("Z", "+00:00")
-                )
+            if isinstance(data.get("end_date"), str):
+                data["end_date"] = _parse_iso(data["end_date"])
 
             # Validate using Pydantic model
-            metrics = SprintMetrics(**raw_data)
-            return metrics
+            metrics = SprintMetrics(**data)
 
         except Exception as e:
             logger.error(f"Failed to validate metrics data: {e}")
             raise ValueError(f"Invalid metrics data: {str(e)}") from e
 
-    def _get_mock_data(self, count: int = 5) -> List[Dict[str, Any]]:
-        """Generate mock sprint data for testing."""
-        sprints = []
-        for i in range(count):
-            sprint_num = i + 1
-            sprints.append(
-                {
-                    "sprint_id": f"SPRINT-2024-{sprint_num:02d}",
-                    "sprint_name": f"Sprint 24.{sprint_num:02d}",
-                    "start_date": f"2024-{sprint_num:02d}-01T00:00:00",
-                    "end_date": f"2024-{sprint_num:02d}-14T23:59:59",
-                    "team_happiness": 7.5 - (i * 0.2),
-                    "story_points_completed": 40 + (i * 2),
-                    "story_points_planned": 45,
-                    "story_point_distribution": {
-                        "small": 5,
-                        "medium": 8 + i,
-                        "large": 3,
-                    },
-                    "items_completed": 15 + i,
-                    "items_carried_over": 2 + (i % 3),
-                    "items_out_of_sprint_percent": 10.0 + (i * 2),
-                    "defect_rate_production": 0.05 + (i * 0.01),
-                    "defect_rate_all": 0.12 + (i * 0.02),
-                    "bugs_prod": 2 + i,
-                    "bugs_acc": 3 + i,
-                    "bugs_test": 4,
-                    "bugs_dev": 1,
-                    "bugs_other": 0,
-                    "open_bugs_count": 5 + (i * 2),
-                    "bugs_missed_testing": 3,
-                    "bugs_missed_impact": 2,
-                    "bugs_requirement_gap": 1,
-                    "bugs_configuration": 1,
-                    "bugs_third_party": 1,
-                    "bugs_database": 1,
-                    "bugs_security": 0,
-                    "coding_time": 100.0 + (i * 5),
-                    "review_time": 20.0 + (i * 3),
-                    "testing_time": 18.0 + (i * 2),
-                }
+        if isinstance(sprint_id, str):
+            # Snapshot the payload and model so later caller edits don't leak in
+            self._validated_cache[sprint_id] = (
+                _copy_payload(raw_data),
+                _copy_metrics(metrics),
             )
+            self._validated_cache.move_to_end(sprint_id)
+            if len(self._validated_cache) > _VALIDATED_CACHE_SIZE:
+                self._validated_cache.popitem(last=False)
+        return metrics
 
+    def _get_mock_data(self, count: int = 5) -> List[Dict[str, Any]]:
+        """Generate mock sprint data for testing."""
+        # Hand out copies so callers can't change the shared mock sprints
+        sprints = [_copy_payload(sprint) for sprint in _MOCK_SPRINTS_ALL[:count]]
+        sprints.extend(
+            _build_mock_sprint(i) for i in range(len(_MOCK_SPRINTS_ALL), count)
+        )
         return sprints
 
     def _get_mock_sprint_data(self, sprint_id: str) -> Dict[str, Any]:
         """Generate mock data for a specific sprint."""
+        if sprint_id in _MOCK_SPRINTS_BY_ID:
+            return _copy_payload(_MOCK_SPRINTS_BY_ID[sprint_id])
         return {
             "sprint_id": sprint_id,
             "sprint_name": f"Sprint {sprint_id.split('-')[-1]}",
-            "start_date": "2024-01-01T00:00:00",
-            "end_date": "2024-01-14T23:59:59",
+            "start_date": _MOCK_START,
+            "end_date": _MOCK_END,
             "team_happiness": 7.5,
             "story_points_completed": 42,
             "story_points_planned": 45,
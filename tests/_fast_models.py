@@ -0,0 +1,54 @@
+"""
+Helpers for building Pydantic models cheaply in tests.
+"""
+
+import typing
+from functools import lru_cache
+
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=32)
+def _ta(cls):
+    """Return a TypeAdapter for ``cls``, built once per type."""
+    return TypeAdapter(cls)
+
+
+def _model_type(annotation):
+    """Return the BaseModel subclass wrapped by an annotation, if any."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in typing.get_args(annotation):
+        model = _model_type(arg)
+        if model is not None:
+            return model
+    return None
+
+
+def _trusted_value(annotation, value):
+    """Construct nested models in ``value`` without validation."""
+    model = _model_type(annotation)
+    if model is None:
+        return value
+    if isinstance(value, dict):
+        return _trusted(model, **value)
+    if isinstance(value, list):
+        return [_trusted_value(annotation, item) for item in value]
+    return value
+
+
+def _trusted(cls, **kw):
+    """
+    Build ``cls`` from trusted literal data, skipping validation.
+
+    Nested models given as dicts (directly, in lists or behind Optional)
+    are constructed recursively. Use only where validation is not under test.
+    """
+    fields = cls.model_fields
+    values = {
+        name: (
+            _trusted_value(fields[name].annotation, value) if name in fields else value
+        )
+        for name, value in kw.items()
+    }
+    return cls.model_construct(**values)
@@ -1,6 +1,7 @@
 """Shared test configuration and fixtures."""
 
 import os
+from datetime import datetime
 from unittest.mock import patch
 
 import pytest
@@ -34,6 +35,21 @@ from dotenv import load_dotenv
 from src.api.dependencies import get_db
 from src.api.main import app
 from src.core.database import Base
+from src.core.models import (
+    AnalysisRequest,
+    AnalysisStatus,
+    ChartData,
+    CorrelationResult,
+    Evidence,
+    ExperimentSuggestion,
+    FacilitationGuide,
+    Hypothesis,
+    MetricsSyncRequest,
+    RetrospectiveReport,
+    SprintMetrics,
+    TrendAnalysis,
+)
+from tests._fast_models import _ta
 
 load_dotenv()
 
@@ -48,8 +64,9 @@ def setup_test_database():
     """Setup database for each test module (file)."""
     global engine, TestingSessionLocal
 
-    # Create unique database for this test file
-    db_url = "sqlite:///./test.db"
+    # Create unique database for this test file (one per xdist worker)
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    db_url = f"sqlite:///./test{'_' + worker if worker else ''}.db"
     engine = create_engine(db_url, connect_args={"check_same_thread": False})
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -100,6 +117,27 @@ def mock_llm(setup_test_database):
         yield mock
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _prewarm_pydantic():
+    """Build model validators up front so no single test pays for them."""
+    for cls in (
+        SprintMetrics,
+        TrendAnalysis,
+        CorrelationResult,
+        Evidence,
+        Hypothesis,
+        ExperimentSuggestion,
+        ChartData,
+        FacilitationGuide,
+        RetrospectiveReport,
+        MetricsSyncRequest,
+        AnalysisRequest,
+        AnalysisStatus,
+    ):
+        cls.model_rebuild()
+        _ta(cls)
+
+
 @pytest.fixture
 def test_db():
     """Provide a database session for tests that need direct DB access."""
@@ -174,3 +212,72 @@ def sample_sprint_metrics():
         "defect_rate_production": 7.1,
         "story_point_distribution": {"small": 5, "medium": 8, "large": 2},
     }
+
+
+@pytest.fixture(scope="session")
+def sample_trends_review_bottleneck():
+    """Sample trends indicating review bottleneck (shared, read-only)."""
+    return (
+        TrendAnalysis(
+            metric_name="review_time",
+            current_value=30.0,
+            previous_value=20.0,
+            change_percent=50.0,
+            trend_direction="up",
+            is_significant=True,
+        ),
+        TrendAnalysis(
+            metric_name="team_happiness",
+            current_value=6.5,
+            previous_value=7.5,
+            change_percent=-13.3,
+            trend_direction="down",
+            is_significant=False,
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_correlations():
+    """Sample correlation results (shared, read-only)."""
+    return (
+        CorrelationResult(
+            metric_1="review_time",
+            metric_2="defect_rate_production",
+            correlation_coefficient=0.75,
+            is_strong=True,
+            interpretation="Strong positive correlation",
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_sprints_quality_issues():
+    """Sample sprints with quality issues (shared, read-only)."""
+    return (
+        SprintMetrics(
+            sprint_id="SPRINT-1",
+            sprint_name="Sprint 1",
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 14),
+            defect_rate_production=0.05,
+            bugs_prod=2,
+            bugs_test=8,
+            bugs_acc=0,
+            bugs_dev=0,
+            bugs_other=0,
+        ),
+        SprintMetrics(
+            sprint_id="SPRINT-2",
+            sprint_name="Sprint 2",
+            start_date=datetime(2024, 2, 1),
+            end_date=datetime(2024, 2, 14),
+            defect_rate_production=0.08,
+            bugs_prod=5,  # 50% of bugs in production
+            bugs_test=3,
+            bugs_acc=2,
+            bugs_dev=0,
+            bugs_other=0,
+            bugs_missed_testing=3,
+        ),
+    )
@@ -5,6 +5,7 @@ Unit tests for database models and operations.
 from datetime import datetime
 
 import pytest
+from sqlalchemy import select
 
 from src.core.database import (
     AnalysisReportDB,
@@ -29,11 +30,7 @@ def test_metrics_snapshot_creation(test_db_session, sample_sprint_metrics):
     test_db_session.commit()
 
     # Query back
-    retrieved = (
-        test_db_session.query(MetricsSnapshot)
-        .filter_by(sprint_id=sample_sprint_metrics["sprint_id"])
-        .first()
-    )
+    retrieved = test_db_session.get(MetricsSnapshot, snapshot.id)
 
     assert retrieved is not None
     assert retrieved.sprint_id == sample_sprint_metrics["sprint_id"]
@@ -88,11 +85,7 @@ def test_analysis_report_creation(test_db_session):
     test_db_session.add(report)
     test_db_session.commit()
 
-    retrieved = (
-        test_db_session.query(AnalysisReportDB)
-        .filter_by(headline="Test headline")
-        .first()
-    )
+    retrieved = test_db_session.get(AnalysisReportDB, report.id)
 
     assert retrieved is not None
     assert retrieved.headline == "Test headline"
@@ -132,9 +125,7 @@ def test_hypothesis_db_creation(test_db_session):
     test_db_session.add(hypothesis)
     test_db_session.commit()
 
-    retrieved = (
-        test_db_session.query(HypothesisDB).filter_by(report_id=report.id).first()
-    )
+    retrieved = test_db_session.get(HypothesisDB, hypothesis.id)
 
     assert retrieved is not None
     assert retrieved.title == "Review bottleneck"
@@ -172,9 +163,7 @@ def test_experiment_db_creation(test_db_session):
     test_db_session.add(experiment)
     test_db_session.commit()
 
-    retrieved = (
-        test_db_session.query(ExperimentDB).filter_by(report_id=report.id).first()
-    )
+    retrieved = test_db_session.get(ExperimentDB, experiment.id)
 
     assert retrieved is not None
     assert retrieved.title == "Set WIP limit"
@@ -216,7 +205,7 @@ def test_experiment_status_transition(test_db_session):
     experiment.started_at = datetime.now()
     test_db_session.commit()
 
-    retrieved = test_db_session.query(ExperimentDB).first()
+    retrieved = test_db_session.get(ExperimentDB, experiment.id)
     assert retrieved.status == "in_progress"
     assert retrieved.started_at is not None
 
@@ -235,9 +224,7 @@ def test_analysis_task_db_creation(test_db_session):
     test_db_session.add(task)
     test_db_session.commit()
 
-    retrieved = (
-        test_db_session.query(AnalysisTaskDB).filter_by(task_id="task-12345").first()
-    )
+    retrieved = test_db_session.get(AnalysisTaskDB, task.id)
 
     assert retrieved is not None
     assert retrieved.status == "pending"
@@ -258,7 +245,7 @@ def test_analysis_task_progress_update(test_db_session):
     task.started_at = datetime.now()
     test_db_session.commit()
 
-    retrieved = test_db_session.query(AnalysisTaskDB).first()
+    retrieved = test_db_session.get(AnalysisTaskDB, task.id)
     assert retrieved.status == "running"
     assert retrieved.progress_percent == 50
     assert retrieved.message == "Analyzing trends..."
@@ -295,9 +282,9 @@ def test_query_multiple_hypotheses_by_report(test_db_session):
 
     test_db_session.commit()
 
-    hypotheses = (
-        test_db_session.query(HypothesisDB).filter_by(report_id=report.id).all()
-    )
+    hypotheses = test_db_session.scalars(
+        select(HypothesisDB).where(HypothesisDB.report_id == report.id)
+    ).all()
 
     assert len(hypotheses) == 3
     assert all(h.report_id == report.id for h in hypotheses)
@@ -21,6 +21,15 @@ from src.core.models import (
     SprintMetrics,
     TrendAnalysis,
 )
+from tests._fast_models import _ta, _trusted
+
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+_CHART_PAYLOAD = {"x": [1, 2, 3], "y": [4, 5, 6]}
+_CHART_CASES = tuple(
+    (f"chart_{t}", t, f"Test {t} chart")
+    for t in ("line", "bar", "heatmap", "box", "scatter")
+)
 
 
 def test_sprint_metrics_valid(sample_sprint_metrics):
@@ -37,8 +46,8 @@ def test_sprint_metrics_happiness_validation():
         SprintMetrics(
             sprint_id="TEST",
             sprint_name="Test",
-            start_date=datetime.now(),
-            end_date=datetime.now(),
+            start_date=_NOW,
+            end_date=_NOW,
             team_happiness=11.0,  # Invalid: > 10
         )
 
@@ -131,16 +140,18 @@ def test_experiment_suggestion():
     assert len(experiment.success_metrics) == 2
 
 
-def test_chart_data_types():
-    """Test ChartData with different chart types."""
-    for chart_type in ["line", "bar", "heatmap", "box", "scatter"]:
-        chart = ChartData(
-            chart_id=f"chart_{chart_type}",
-            chart_type=chart_type,
-            title=f"Test {chart_type} chart",
-            data={"x": [1, 2, 3], "y": [4, 5, 6]},
-        )
-        assert chart.chart_type == chart_type
+@pytest.mark.parametrize("chart_id, chart_type, title", _CHART_CASES)
+def test_chart_data_type(chart_id, chart_type, title):
+    """Test ChartData with each chart type."""
+    chart = _ta(ChartData).validate_python(
+        {
+            "chart_id": chart_id,
+            "chart_type": chart_type,
+            "title": title,
+            "data": _CHART_PAYLOAD,
+        }
+    )
+    assert chart.chart_type == chart_type
 
 
 def test_facilitation_guide():
@@ -169,12 +180,13 @@ def test_retrospective_report_structure():
         report_id="RPT-2024-001",
         headline="Review time increased 28%",
         sprint_period="Sprint 24.01 - 24.05",
-        generated_at=datetime.now(),
+        generated_at=_NOW,
         trends=[],
         correlations=[],
         charts=[],
         hypotheses=[
-            Hypothesis(
+            _trusted(
+                Hypothesis,
                 title="Test",
                 description="Test hypothesis",
                 confidence="High",
@@ -185,7 +197,8 @@ def test_retrospective_report_structure():
             )
         ],
         suggested_experiments=[
-            ExperimentSuggestion(
+            _trusted(
+                ExperimentSuggestion,
                 title="Test experiment",
                 description="Test",
                 rationale="Test",
@@ -194,8 +207,11 @@ def test_retrospective_report_structure():
                 expected_outcome="outcome",
             )
         ],
-        facilitation_guide=FacilitationGuide(
-            retro_questions=["Q1", "Q2", "Q3"], agenda_15min=["A1"], focus_areas=["F1"]
+        facilitation_guide=_trusted(
+            FacilitationGuide,
+            retro_questions=["Q1", "Q2", "Q3"],
+            agenda_15min=["A1"],
+            focus_areas=["F1"],
         ),
         sprints_analyzed=5,
         confidence_overall="High",
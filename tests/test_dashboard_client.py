@@ -1,7 +1,10 @@
 """Tests for dashboard data client."""
 
+import asyncio
+import json
+
+import httpx
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta
 
 from src.utils.dashboard_client import (
@@ -11,20 +14,88 @@ from src.utils.dashboard_client import (
     get_dashboard_client,
 )
 
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+_EXPECTED_CHART_NAMES = frozenset(
+    {
+        "testing-time",
+        "review-time",
+        "coding-time",
+        "root-cause",
+        "open-bugs-over-time",
+        "bugs-per-environment",
+        "sp-distribution",
+        "items-out-of-sprint",
+        "defect-rate-prod",
+        "defect-rate-all",
+        "happiness",
+    }
+)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned to _NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _NOW
+
+
+class _FakeResp:
+    """Minimal stand-in for an httpx response."""
+
+    __slots__ = ("status_code", "_json", "text")
+
+    def __init__(self, json_data, status_code=200):
+        self.status_code = status_code
+        self._json = json_data
+        self.text = json.dumps(json_data)
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        pass
+
+
+class _NoJsonResp(_FakeResp):
+    """Fake response whose json() must not be used."""
+
+    __slots__ = ()
 
-@pytest.fixture
+    def json(self):
+        raise AssertionError("response.json() was called")
+
+
+@pytest.fixture(scope="session")
+def make_resp():
+    """Factory for fake HTTP responses."""
+
+    def _make(json_data=None, status=200):
+        return _FakeResp(json_data, status)
+
+    return _make
+
+
+@pytest.fixture(scope="module")
 def dashboard_client():
-    """Create a dashboard client instance for testing."""
+    """Create a dashboard client instance shared by the module."""
     return DashboardClient(timeout=10)
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_dashboard_client(dashboard_client):
+    """Clear token state left behind by the previous test."""
+    dashboard_client.invalidate_token()
+
+
+@pytest.fixture(scope="session")
 def mock_token_response():
     """Mock token response from API."""
     return {"token": "test-token-12345"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_chart_data():
     """Mock chart data response from API."""
     return {
@@ -34,102 +105,132 @@ def mock_chart_data():
     }
 
 
+@pytest.mark.asyncio(scope="class")
 class TestDashboardClient:
-    """Test suite for DashboardClient."""
+    """Async test suite for DashboardClient, sharing one event loop."""
 
-    @pytest.mark.asyncio
-    async def test_fetch_token_success(self, dashboard_client, mock_token_response):
+    async def test_fetch_token_success(
+        self, dashboard_client, mock_token_response, make_resp, mocker
+    ):
         """Test successful token fetch."""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.json.return_value = mock_token_response
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mocker.patch.object(
+            dashboard_client,
+            "_http_get",
+            return_value=make_resp(mock_token_response),
+        )
 
-            token = await dashboard_client._fetch_token()
+        token = await dashboard_client._fetch_token()
 
-            assert token == "test-token-12345"
-            assert dashboard_client._token == "test-token-12345"
-            assert dashboard_client._token_expires_at is not None
+        assert token == "test-token-12345"
+        assert dashboard_client._token == "test-token-12345"
+        assert dashboard_client._token_expires_at is not None
 
-    @pytest.mark.asyncio
-    async def test_fetch_token_no_token_in_response(self, dashboard_client):
+    async def test_fetch_token_no_token_in_response(
+        self, dashboard_client, make_resp, mocker
+    ):
         """Test token fetch with missing token in response."""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {}
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mocker.patch.object(dashboard_client, "_http_get", return_value=make_resp({}))
 
-            with pytest.raises(DashboardAPIError, match="No token in response"):
-                await dashboard_client._fetch_token()
+        with pytest.raises(DashboardAPIError, match="No token in response"):
+            await dashboard_client._fetch_token()
 
-    @pytest.mark.asyncio
     async def test_get_valid_token_fresh_token(
-        self, dashboard_client, mock_token_response
+        self, dashboard_client, mock_token_response, mocker
     ):
         """Test getting valid token when token is fresh."""
+        mocker.patch("src.utils.dashboard_client.datetime", _FrozenDatetime)
+
         # Set a valid token
         dashboard_client._token = "existing-token"
-        dashboard_client._token_expires_at = datetime.now() + timedelta(seconds=100)
+        dashboard_client._token_expires_at = _NOW + timedelta(seconds=100)
 
         token = await dashboard_client._get_valid_token()
 
         assert token == "existing-token"
 
-    @pytest.mark.asyncio
     async def test_get_valid_token_expired_token(
-        self, dashboard_client, mock_token_response
+        self, dashboard_client, mock_token_response, make_resp, mocker
     ):
         """Test getting valid token when token is expired."""
+        mocker.patch("src.utils.dashboard_client.datetime", _FrozenDatetime)
+
         # Set an expired token
         dashboard_client._token = "expired-token"
-        dashboard_client._token_expires_at = datetime.now() - timedelta(seconds=10)
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.json.return_value = mock_token_response
-            mock_response.raise_for_status = MagicMock()
+        dashboard_client._token_expires_at = _NOW - timedelta(seconds=10)
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mocker.patch.object(
+            dashboard_client,
+            "_http_get",
+            return_value=make_resp(mock_token_response),
+        )
 
-            token = await dashboard_client._get_valid_token()
+        token = await dashboard_client._get_valid_token()
 
-            assert token == "test-token-12345"
+        assert token == "test-token-12345"
 
-    @pytest.mark.asyncio
     async def test_fetch_chart_data_success(
-        self, dashboard_client, mock_token_response, mock_chart_data
+        self,
+        dashboard_client,
+        mock_token_response,
+        mock_chart_data,
+        make_resp,
+        mocker,
     ):
         """Test successful chart data fetch."""
-        with patch.object(
+        mocker.patch.object(
+            dashboard_client,
+            "_http_get",
+            return_value=make_resp(mock_chart_data),
+        )
+
+        mocker.patch.object(
             dashboard_client, "_get_valid_token", return_value="test-token"
-        ):
-            with patch("httpx.AsyncClient") as mock_client:
-                mock_response = MagicMock()
-                mock_response.status_code = 200
-                mock_response.json.return_value = mock_chart_data
-                mock_response.raise_for_status = MagicMock()
+        )
+        data = await dashboard_client.fetch_chart_data("happiness")
 
-                mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                    return_value=mock_response
-                )
+        assert data == mock_chart_data
+
+    async def test_fetch_chart_data_json_path(
+        self, dashboard_client, mock_chart_data, mocker
+    ):
+        """Test chart data is decoded from the raw body, not response.json()."""
+        mocker.patch.object(
+            dashboard_client,
+            "_http_get",
+            return_value=_NoJsonResp(mock_chart_data),
+        )
+        mocker.patch.object(
+            dashboard_client, "_get_valid_token", return_value="test-token"
+        )
+
+        data = await dashboard_client.fetch_chart_data("happiness")
+
+        assert data == mock_chart_data
+
+    async def test_fetch_chart_data_honours_charset(self, dashboard_client, mocker):
+        """Test non-UTF-8 bodies are decoded with the declared charset."""
+        response = httpx.Response(
+            200,
+            content='{"labels": ["Sprint Müller"]}'.encode("latin-1"),
+            headers={"Content-Type": "application/json; charset=iso-8859-1"},
+            request=httpx.Request("GET", DashboardClient.DATA_URL),
+        )
+        mocker.patch.object(dashboard_client, "_http_get", return_value=response)
+        mocker.patch.object(
+            dashboard_client, "_get_valid_token", return_value="test-token"
+        )
 
-                data = await dashboard_client.fetch_chart_data("happiness")
+        data = await dashboard_client.fetch_chart_data("happiness")
 
-                assert data == mock_chart_data
+        assert data == {"labels": ["Sprint Müller"]}
 
-    @pytest.mark.asyncio
     async def test_fetch_chart_data_with_retry_on_auth_error(
-        self, dashboard_client, mock_token_response, mock_chart_data
+        self,
+        dashboard_client,
+        mock_token_response,
+        mock_chart_data,
+        make_resp,
+        mocker,
     ):
         """Test chart data fetch with retry on authentication error."""
         call_count = 0
@@ -138,68 +239,169 @@ class TestDashboardClient:
             nonlocal call_count
             call_count += 1
 
-            mock_response = MagicMock()
             if call_count == 1:
                 # First call returns 401
-                mock_response.status_code = 401
-            else:
-                # Second call returns success
-                mock_response.status_code = 200
-                mock_response.json.return_value = mock_chart_data
+                return make_resp(status=401)
+            # Second call returns success
+            return make_resp(mock_chart_data)
 
-            mock_response.raise_for_status = MagicMock()
-            return mock_response
+        mocker.patch.object(dashboard_client, "_http_get", side_effect=mock_get)
 
-        with patch.object(
+        mocker.patch.object(
             dashboard_client, "_get_valid_token", return_value="test-token"
-        ):
-            with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get = mock_get
+        )
+        data = await dashboard_client.fetch_chart_data("happiness")
 
-                data = await dashboard_client.fetch_chart_data("happiness")
+        assert data == mock_chart_data
+        assert call_count == 2
 
-                assert data == mock_chart_data
-                assert call_count == 2
-
-    @pytest.mark.asyncio
     async def test_fetch_all_charts(
-        self, dashboard_client, mock_token_response, mock_chart_data
+        self, dashboard_client, mock_token_response, mock_chart_data, mocker
     ):
         """Test fetching all charts."""
-        with patch.object(
+        mocker.patch.object(
             dashboard_client, "fetch_chart_data", return_value=mock_chart_data
-        ):
-            results = await dashboard_client.fetch_all_charts()
+        )
+        results = await dashboard_client.fetch_all_charts()
 
-            assert isinstance(results, dict)
-            assert len(results) == 11  # Total number of chart types
-            assert "happiness" in results
-            assert "defect-rate-all" in results
+        assert results.keys() == _EXPECTED_CHART_NAMES
 
-    @pytest.mark.asyncio
     async def test_fetch_multiple_charts(
-        self, dashboard_client, mock_token_response, mock_chart_data
+        self, dashboard_client, mock_token_response, mock_chart_data, mocker
     ):
         """Test fetching specific multiple charts."""
-        with patch.object(
+        mocker.patch.object(
             dashboard_client, "fetch_chart_data", return_value=mock_chart_data
-        ):
-            chart_names = ["happiness", "review-time", "coding-time"]
-            results = await dashboard_client.fetch_multiple_charts(chart_names)
+        )
+        chart_names = ["happiness", "review-time", "coding-time"]
+        results = await dashboard_client.fetch_multiple_charts(chart_names)
+
+        assert isinstance(results, dict)
+        assert len(results) == 3
+        assert all(name in results for name in chart_names)
+
+    async def test_fetch_all_charts_runs_concurrently(
+        self, dashboard_client, mock_chart_data, mocker
+    ):
+        """Test that chart requests are awaited together, not one by one."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch(chart_name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return mock_chart_data
+
+        mocker.patch.object(
+            dashboard_client, "fetch_chart_data", side_effect=fake_fetch
+        )
+        results = await dashboard_client.fetch_all_charts()
+
+        assert results.keys() == _EXPECTED_CHART_NAMES
+        assert peak == len(_EXPECTED_CHART_NAMES)
+
+    async def test_fetch_multiple_charts_records_errors(
+        self, dashboard_client, mock_chart_data, mocker
+    ):
+        """Test that one failing chart does not affect the others."""
+
+        async def fake_fetch(chart_name):
+            if chart_name == "review-time":
+                raise DashboardAPIError("boom")
+            return mock_chart_data
+
+        mocker.patch.object(
+            dashboard_client, "fetch_chart_data", side_effect=fake_fetch
+        )
+        results = await dashboard_client.fetch_multiple_charts(
+            ["happiness", "review-time"]
+        )
+
+        assert results["happiness"] == mock_chart_data
+        assert results["review-time"] == {"error": "boom"}
+
+    async def test_concurrent_token_refresh_fetches_once(
+        self, dashboard_client, mocker
+    ):
+        """Test that concurrent callers share a single token refresh."""
+
+        async def fake_fetch_token():
+            await asyncio.sleep(0)
+            return "shared-token"
+
+        mock_fetch = mocker.patch.object(
+            dashboard_client, "_fetch_token", side_effect=fake_fetch_token
+        )
+        tokens = await asyncio.gather(
+            *(dashboard_client._get_valid_token() for _ in range(5))
+        )
+
+        assert tokens == ["shared-token"] * 5
+        assert mock_fetch.call_count == 1
 
-            assert isinstance(results, dict)
-            assert len(results) == 3
-            assert all(name in results for name in chart_names)
+    async def test_cancelled_waiter_does_not_cancel_token_refresh(
+        self, dashboard_client, mocker
+    ):
+        """Test that cancelling one caller leaves the shared refresh running."""
+        release = asyncio.Event()
+
+        async def fake_fetch_token():
+            await release.wait()
+            return "shared-token"
+
+        mocker.patch.object(
+            dashboard_client, "_fetch_token", side_effect=fake_fetch_token
+        )
+        waiters = [
+            asyncio.ensure_future(dashboard_client._get_valid_token()) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        waiters[0].cancel()
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert results[1:] == ["shared-token", "shared-token"]
+
+    async def test_token_refresh_pending_on_closed_loop_is_replaced(
+        self, dashboard_client, mocker
+    ):
+        """Test a refresh left pending on a closed event loop is not awaited."""
+        old_loop = asyncio.new_event_loop()
+        dashboard_client._token_refresh = old_loop.create_future()
+        old_loop.close()
 
-    def test_invalidate_token(self, dashboard_client):
-        """Test token invalidation."""
-        dashboard_client._token = "some-token"
-        dashboard_client._token_expires_at = datetime.now() + timedelta(seconds=100)
+        async def fake_fetch_token():
+            return "fresh-token"
 
-        dashboard_client.invalidate_token()
+        mocker.patch.object(
+            dashboard_client, "_fetch_token", side_effect=fake_fetch_token
+        )
 
-        assert dashboard_client._token is None
-        assert dashboard_client._token_expires_at is None
+        assert await dashboard_client._get_valid_token() == "fresh-token"
+        assert dashboard_client._token_refresh is None
+
+    async def test_fetch_multiple_charts_propagates_cancellation(
+        self, dashboard_client, mock_chart_data, mocker
+    ):
+        """Test that a cancelled chart request is raised, not recorded."""
+
+        async def fake_fetch(chart_name):
+            if chart_name == "review-time":
+                raise asyncio.CancelledError()
+            return mock_chart_data
+
+        mocker.patch.object(
+            dashboard_client, "fetch_chart_data", side_effect=fake_fetch
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            await dashboard_client.fetch_multiple_charts(["happiness", "review-time"])
 
 
 def test_get_dashboard_client_singleton():
@@ -208,3 +410,14 @@ def test_get_dashboard_client_singleton():
     client2 = get_dashboard_client()
 
     assert client1 is client2
+
+
+def test_invalidate_token(dashboard_client):
+    """Test token invalidation."""
+    dashboard_client._token = "some-token"
+    dashboard_client._token_expires_at = _NOW + timedelta(seconds=100)
+
+    dashboard_client.invalidate_token()
+
+    assert dashboard_client._token is None
+    assert dashboard_client._token_expires_at is None
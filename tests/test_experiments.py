@@ -5,41 +5,41 @@ Unit tests for experiment suggestion engine.
 import pytest
 
 from src.analysis.experiments import ExperimentGenerator, get_experiment_generator
-from src.core.models import Evidence, Hypothesis
-
-
-@pytest.fixture
-def generator():
-    """Create experiment generator instance."""
-    return ExperimentGenerator()
-
-
-@pytest.fixture
-def review_bottleneck_hypothesis():
-    """Hypothesis about review bottleneck."""
-    return Hypothesis(
+from src.core.models import Hypothesis
+from tests._fast_models import _trusted
+
+_SHARED_METRICS = ("test",)
+_STUB_KW = dict(
+    description="Test",
+    confidence="Medium",
+    confidence_score=0.6,
+    evidence=(),
+    potential_impact="Test",
+    affected_metrics=_SHARED_METRICS,
+)
+
+
+_HYPOTHESES = {
+    "review_bottleneck": _trusted(
+        Hypothesis,
         title="Review Process Bottleneck",
         description="Review time has increased significantly",
         confidence="High",
         confidence_score=0.85,
         evidence=[
-            Evidence(metric_name="review_time", trend="up 50%", value="20 → 30 hours")
+            dict(metric_name="review_time", trend="up 50%", value="20 → 30 hours")
         ],
         potential_impact="Slower delivery",
         affected_metrics=["review_time", "cycle_time"],
-    )
-
-
-@pytest.fixture
-def story_sizing_hypothesis():
-    """Hypothesis about story sizing issues."""
-    return Hypothesis(
+    ),
+    "story_sizing": _trusted(
+        Hypothesis,
         title="Story Sizing and Slicing Issues",
         description="Too many large stories",
         confidence="Medium",
         confidence_score=0.7,
         evidence=[
-            Evidence(
+            dict(
                 metric_name="items_out_of_sprint_percent",
                 trend="up 30%",
                 value="15% → 20%",
@@ -47,19 +47,15 @@ def story_sizing_hypothesis():
         ],
         potential_impact="Reduced predictability",
         affected_metrics=["sprint_completion_rate"],
-    )
-
-
-@pytest.fixture
-def quality_hypothesis():
-    """Hypothesis about quality issues."""
-    return Hypothesis(
+    ),
+    "quality": _trusted(
+        Hypothesis,
         title="Quality Assurance Process Degradation",
         description="Defect rate increasing",
         confidence="High",
         confidence_score=0.8,
         evidence=[
-            Evidence(
+            dict(
                 metric_name="defect_rate_production",
                 trend="up 100%",
                 value="0.05 → 0.10",
@@ -67,13 +63,27 @@ def quality_hypothesis():
         ],
         potential_impact="Customer dissatisfaction",
         affected_metrics=["defect_rate_production"],
-    )
+    ),
+}
+
+
+@pytest.fixture
+def generator():
+    """Shared experiment generator instance."""
+    return get_experiment_generator()
+
+
+@pytest.fixture(scope="session")
+def hypothesis(request):
+    """Prebuilt hypothesis selected by key via indirect parametrization."""
+    return _HYPOTHESES[request.param]
 
 
 def test_generator_initialization(generator):
     """Test ExperimentGenerator initialization."""
     assert generator is not None
     assert isinstance(generator.templates, list)
+    assert generator.templates is generator.templates
 
 
 def test_generate_experiments_empty(generator):
@@ -83,54 +93,36 @@ def test_generate_experiments_empty(generator):
     assert len(experiments) == 0
 
 
-def test_generate_experiment_for_review_bottleneck(
-    generator, review_bottleneck_hypothesis
+@pytest.mark.parametrize(
+    "hypothesis, title_words, metric_fragment",
+    [
+        ("review_bottleneck", ("WIP", "Review"), "review_time"),
+        ("story_sizing", ("Slicing", "Story"), "items_out_of_sprint_percent"),
+        ("quality", ("Testing", "Quality"), "defect_rate"),
+    ],
+    indirect=["hypothesis"],
+)
+def test_generate_experiment_for_hypothesis_type(
+    generator, hypothesis, title_words, metric_fragment
 ):
-    """Test generating experiment for review bottleneck."""
-    experiments = generator.generate_experiments([review_bottleneck_hypothesis])
+    """Test generating a tailored experiment for each hypothesis type."""
+    experiments = generator.generate_experiments([hypothesis])
 
     assert len(experiments) == 1
     exp = experiments[0]
 
-    assert "WIP" in exp.title or "Review" in exp.title
+    assert any(word in exp.title for word in title_words)
     assert exp.duration_sprints >= 1
     assert len(exp.success_metrics) > 0
     assert len(exp.implementation_steps) > 0
     assert exp.expected_outcome
     assert exp.related_hypothesis_index == 0
+    assert metric_fragment in str(exp.success_metrics).lower()
 
 
-def test_generate_experiment_for_story_sizing(generator, story_sizing_hypothesis):
-    """Test generating experiment for story sizing."""
-    experiments = generator.generate_experiments([story_sizing_hypothesis])
-
-    assert len(experiments) == 1
-    exp = experiments[0]
-
-    assert "Slicing" in exp.title or "Story" in exp.title
-    assert exp.duration_sprints >= 1
-    assert (
-        "story_point_distribution" in exp.success_metrics
-        or "items_out_of_sprint_percent" in exp.success_metrics
-    )
-
-
-def test_generate_experiment_for_quality(generator, quality_hypothesis):
-    """Test generating experiment for quality issues."""
-    experiments = generator.generate_experiments([quality_hypothesis])
-
-    assert len(experiments) == 1
-    exp = experiments[0]
-
-    assert "Testing" in exp.title or "Quality" in exp.title
-    assert "defect_rate" in str(exp.success_metrics).lower()
-
-
-def test_generate_multiple_experiments(
-    generator, review_bottleneck_hypothesis, story_sizing_hypothesis
-):
+def test_generate_multiple_experiments(generator):
     """Test generating multiple experiments."""
-    hypotheses = [review_bottleneck_hypothesis, story_sizing_hypothesis]
+    hypotheses = [_HYPOTHESES["review_bottleneck"], _HYPOTHESES["story_sizing"]]
     experiments = generator.generate_experiments(hypotheses, max_experiments=3)
 
     assert len(experiments) == 2
@@ -141,15 +133,7 @@ def test_generate_multiple_experiments(
 def test_max_experiments_limit(generator):
     """Test that max_experiments limit is respected."""
     hypotheses = [
-        Hypothesis(
-            title=f"Hypothesis {i}",
-            description="Test",
-            confidence="Medium",
-            confidence_score=0.6,
-            evidence=[],
-            potential_impact="Test",
-            affected_metrics=["test"],
-        )
+        Hypothesis.model_construct(title=f"Hypothesis {i}", **_STUB_KW)
         for i in range(5)
     ]
 
@@ -157,9 +141,10 @@ def test_max_experiments_limit(generator):
     assert len(experiments) <= 2
 
 
-def test_experiment_has_required_fields(generator, review_bottleneck_hypothesis):
+@pytest.mark.parametrize("hypothesis", ["review_bottleneck"], indirect=True)
+def test_experiment_has_required_fields(generator, hypothesis):
     """Test that experiments have all required fields."""
-    experiments = generator.generate_experiments([review_bottleneck_hypothesis])
+    experiments = generator.generate_experiments([hypothesis])
     exp = experiments[0]
 
     assert exp.title
@@ -229,20 +214,20 @@ def test_generic_experiment_fallback(generator):
     assert len(experiments[0].implementation_steps) > 0
 
 
-def test_experiment_rationale_includes_hypothesis(
-    generator, review_bottleneck_hypothesis
-):
+@pytest.mark.parametrize("hypothesis", ["review_bottleneck"], indirect=True)
+def test_experiment_rationale_includes_hypothesis(generator, hypothesis):
     """Test that experiment rationale references the hypothesis."""
-    experiments = generator.generate_experiments([review_bottleneck_hypothesis])
+    experiments = generator.generate_experiments([hypothesis])
     exp = experiments[0]
 
     assert "Addressing:" in exp.rationale
-    assert review_bottleneck_hypothesis.title in exp.rationale
+    assert hypothesis.title in exp.rationale
 
 
-def test_implementation_steps_are_actionable(generator, review_bottleneck_hypothesis):
+@pytest.mark.parametrize("hypothesis", ["review_bottleneck"], indirect=True)
+def test_implementation_steps_are_actionable(generator, hypothesis):
     """Test that implementation steps are concrete and actionable."""
-    experiments = generator.generate_experiments([review_bottleneck_hypothesis])
+    experiments = generator.generate_experiments([hypothesis])
     exp = experiments[0]
 
     # Should have multiple steps
@@ -254,9 +239,10 @@ def test_implementation_steps_are_actionable(generator, review_bottleneck_hypoth
         assert len(step) > 10  # Meaningful length
 
 
-def test_success_metrics_are_measurable(generator, story_sizing_hypothesis):
+@pytest.mark.parametrize("hypothesis", ["story_sizing"], indirect=True)
+def test_success_metrics_are_measurable(generator, hypothesis):
     """Test that success metrics are appropriate."""
-    experiments = generator.generate_experiments([story_sizing_hypothesis])
+    experiments = generator.generate_experiments([hypothesis])
     exp = experiments[0]
 
     assert len(exp.success_metrics) > 0
@@ -267,12 +253,10 @@ def test_success_metrics_are_measurable(generator, story_sizing_hypothesis):
         assert "_" in metric or metric.islower()
 
 
-def test_experiment_duration_realistic(
-    generator, review_bottleneck_hypothesis, story_sizing_hypothesis
-):
+def test_experiment_duration_realistic(generator):
     """Test that experiment durations are realistic."""
     experiments = generator.generate_experiments(
-        [review_bottleneck_hypothesis, story_sizing_hypothesis]
+        [_HYPOTHESES["review_bottleneck"], _HYPOTHESES["story_sizing"]]
     )
 
     for exp in experiments:
@@ -283,16 +267,15 @@ def test_get_experiment_generator_factory():
     """Test factory function."""
     generator = get_experiment_generator()
     assert isinstance(generator, ExperimentGenerator)
+    assert get_experiment_generator() is generator
 
 
-def test_multiple_hypothesis_types_together(
-    generator, review_bottleneck_hypothesis, quality_hypothesis, story_sizing_hypothesis
-):
+def test_multiple_hypothesis_types_together(generator):
     """Test handling multiple different hypothesis types."""
     hypotheses = [
-        review_bottleneck_hypothesis,
-        quality_hypothesis,
-        story_sizing_hypothesis,
+        _HYPOTHESES["review_bottleneck"],
+        _HYPOTHESES["quality"],
+        _HYPOTHESES["story_sizing"],
     ]
 
     experiments = generator.generate_experiments(hypotheses, max_experiments=3)
@@ -304,9 +287,10 @@ def test_multiple_hypothesis_types_together(
     assert len(set(titles)) == 3  # All unique
 
 
-def test_experiment_expected_outcome_specific(generator, quality_hypothesis):
+@pytest.mark.parametrize("hypothesis", ["quality"], indirect=True)
+def test_experiment_expected_outcome_specific(generator, hypothesis):
     """Test that expected outcomes include specific targets."""
-    experiments = generator.generate_experiments([quality_hypothesis])
+    experiments = generator.generate_experiments([hypothesis])
     exp = experiments[0]
 
     # Should mention a percentage or specific improvement
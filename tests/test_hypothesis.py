@@ -7,84 +7,17 @@ from datetime import datetime
 import pytest
 
 from src.analysis.hypothesis import HypothesisGenerator, get_hypothesis_generator
-from src.core.models import CorrelationResult, Evidence, SprintMetrics, TrendAnalysis
+from src.core.models import Evidence, SprintMetrics, TrendAnalysis
 
+SPRINT1_START, SPRINT1_END = datetime(2024, 1, 1), datetime(2024, 1, 14)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def generator():
-    """Create hypothesis generator instance."""
+    """Create one hypothesis generator shared by the module."""
     return HypothesisGenerator()
 
 
-@pytest.fixture
-def sample_trends_review_bottleneck():
-    """Sample trends indicating review bottleneck."""
-    return [
-        TrendAnalysis(
-            metric_name="review_time",
-            current_value=30.0,
-            previous_value=20.0,
-            change_percent=50.0,
-            trend_direction="up",
-            is_significant=True,
-        ),
-        TrendAnalysis(
-            metric_name="team_happiness",
-            current_value=6.5,
-            previous_value=7.5,
-            change_percent=-13.3,
-            trend_direction="down",
-            is_significant=False,
-        ),
-    ]
-
-
-@pytest.fixture
-def sample_correlations():
-    """Sample correlation results."""
-    return [
-        CorrelationResult(
-            metric_1="review_time",
-            metric_2="defect_rate_production",
-            correlation_coefficient=0.75,
-            is_strong=True,
-            interpretation="Strong positive correlation",
-        )
-    ]
-
-
-@pytest.fixture
-def sample_sprints_quality_issues():
-    """Sample sprints with quality issues."""
-    return [
-        SprintMetrics(
-            sprint_id="SPRINT-1",
-            sprint_name="Sprint 1",
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 1, 14),
-            defect_rate_production=0.05,
-            bugs_prod=2,
-            bugs_test=8,
-            bugs_acc=0,
-            bugs_dev=0,
-            bugs_other=0,
-        ),
-        SprintMetrics(
-            sprint_id="SPRINT-2",
-            sprint_name="Sprint 2",
-            start_date=datetime(2024, 2, 1),
-            end_date=datetime(2024, 2, 14),
-            defect_rate_production=0.08,
-            bugs_prod=5,  # 50% of bugs in production
-            bugs_test=3,
-            bugs_acc=2,
-            bugs_dev=0,
-            bugs_other=0,
-            bugs_missed_testing=3,
-        ),
-    ]
-
-
 def test_generator_initialization(generator):
     """Test HypothesisGenerator initialization."""
     assert generator is not None
@@ -151,8 +84,8 @@ def test_check_story_sizing_issues(generator):
         SprintMetrics(
             sprint_id="SPRINT-1",
             sprint_name="Sprint 1",
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 1, 14),
+            start_date=SPRINT1_START,
+            end_date=SPRINT1_END,
             story_point_distribution={
                 "small": 2,
                 "medium": 3,
@@ -269,9 +202,10 @@ def test_check_defect_patterns(generator, sample_sprints_quality_issues):
     assert "production" in hypothesis.description.lower()
 
 
-def test_generate_multiple_hypotheses(generator):
-    """Test generating multiple hypotheses and ranking."""
-    trends = [
+@pytest.fixture(scope="session")
+def degrading_inputs():
+    """Trends and sprints with several significant regressions, built once."""
+    trends = (
         TrendAnalysis(
             metric_name="review_time",
             current_value=30.0,
@@ -296,26 +230,32 @@ def test_generate_multiple_hypotheses(generator):
             trend_direction="up",
             is_significant=True,
         ),
-    ]
-
-    sprints = [
+    )
+    sprints = (
         SprintMetrics(
             sprint_id="SPRINT-1",
             sprint_name="Sprint 1",
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 1, 14),
-        )
-    ]
+            start_date=SPRINT1_START,
+            end_date=SPRINT1_END,
+        ),
+    )
+    return trends, sprints
+
+
+@pytest.mark.parametrize("max_h,expected", [(1, 1), (3, 3), (5, 3)])
+def test_generate_multiple_hypotheses(generator, degrading_inputs, max_h, expected):
+    """Test generating multiple hypotheses and ranking."""
+    trends, sprints = degrading_inputs
 
     hypotheses = generator.generate_hypotheses(
-        trends=trends, correlations=[], sprints=sprints, max_hypotheses=3
+        trends=trends, correlations=[], sprints=sprints, max_hypotheses=max_h
     )
 
-    assert len(hypotheses) <= 3
+    assert len(hypotheses) == expected
 
     # Check they're sorted by confidence
-    if len(hypotheses) >= 2:
-        assert hypotheses[0].confidence_score >= hypotheses[1].confidence_score
+    scores = [h.confidence_score for h in hypotheses]
+    assert scores == sorted(scores, reverse=True)
 
 
 def test_hypothesis_has_required_fields(generator, sample_trends_review_bottleneck):
@@ -344,25 +284,27 @@ def test_evidence_structure(generator, sample_trends_review_bottleneck):
         assert evidence.value
 
 
-def test_find_trend_helper(generator):
-    """Test _find_trend helper method."""
-    trends = [
-        TrendAnalysis(
-            metric_name="review_time",
-            current_value=30.0,
-            previous_value=20.0,
-            change_percent=50.0,
-            trend_direction="up",
-            is_significant=True,
-        )
-    ]
+_REVIEW_TIME_TRENDS = (
+    TrendAnalysis(
+        metric_name="review_time",
+        current_value=30.0,
+        previous_value=20.0,
+        change_percent=50.0,
+        trend_direction="up",
+        is_significant=True,
+    ),
+)
 
-    found = generator._find_trend(trends, "review_time")
-    assert found is not None
-    assert found.metric_name == "review_time"
 
-    not_found = generator._find_trend(trends, "nonexistent_metric")
-    assert not_found is None
+@pytest.mark.parametrize(
+    "metric_name,expected_name",
+    [("review_time", "review_time"), ("nonexistent_metric", None)],
+)
+def test_find_trend_helper(generator, metric_name, expected_name):
+    """Test _find_trend helper method."""
+    trend = generator._find_trend(_REVIEW_TIME_TRENDS, metric_name)
+
+    assert (trend.metric_name if trend else None) == expected_name
 
 
 def test_find_correlation_helper(generator, sample_correlations):
@@ -379,17 +321,48 @@ def test_find_correlation_helper(generator, sample_correlations):
     assert found_reverse is not None
 
 
-def test_score_to_level_conversion(generator):
+def test_indexed_lookups_match_list_scans(
+    generator, sample_trends_review_bottleneck, sample_correlations
+):
+    """Test that indexed lookups return the same results as list scans."""
+    duplicate = TrendAnalysis(
+        metric_name="review_time",
+        current_value=1.0,
+        previous_value=1.0,
+        change_percent=0.0,
+        trend_direction="stable",
+        is_significant=False,
+    )
+    trends = [*sample_trends_review_bottleneck, duplicate]
+    trend_index = generator._index_trends(trends)
+    corr_index = generator._index_correlations(sample_correlations)
+
+    for name in ("review_time", "team_happiness", "nonexistent_metric"):
+        assert generator._find_trend(trend_index, name) is generator._find_trend(
+            trends, name
+        )
+
+    for pair in (
+        ("review_time", "defect_rate_production"),
+        ("defect_rate_production", "review_time"),
+        ("review_time", "team_happiness"),
+    ):
+        assert generator._find_correlation(
+            corr_index, *pair
+        ) is generator._find_correlation(sample_correlations, *pair)
+
+
+@pytest.mark.parametrize("score,level", [(0.9, "High"), (0.7, "Medium"), (0.3, "Low")])
+def test_score_to_level_conversion(generator, score, level):
     """Test confidence score to level conversion."""
-    assert generator._score_to_level(0.9) == "High"
-    assert generator._score_to_level(0.7) == "Medium"
-    assert generator._score_to_level(0.3) == "Low"
+    assert generator._score_to_level(score) == level
 
 
 def test_get_hypothesis_generator_factory():
     """Test factory function."""
     generator = get_hypothesis_generator()
     assert isinstance(generator, HypothesisGenerator)
+    assert get_hypothesis_generator() is generator
 
 
 def test_no_false_positives(generator):
@@ -418,8 +391,8 @@ def test_no_false_positives(generator):
         SprintMetrics(
             sprint_id="SPRINT-1",
             sprint_name="Sprint 1",
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 1, 14),
+            start_date=SPRINT1_START,
+            end_date=SPRINT1_END,
             bugs_prod=1,
             bugs_test=9,  # Good ratio
         )
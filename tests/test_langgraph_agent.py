@@ -1,18 +1,34 @@
 """Tests for LangGraph AI agent."""
 
+import json
+from collections import namedtuple
+
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from src.analysis.langgraph_agent import (
     DashboardAnalysisAgent,
     AgentState,
+    _parse_chart_names,
     get_dashboard_agent,
 )
 
+# Canned LLM replies, shared by every test
+LLMResp = namedtuple("LLMResp", ["content"])
+
+_CHARTS_RESPONSE = LLMResp('["happiness", "defect-rate-all"]')
+_HAPPINESS_CHARTS_RESPONSE = LLMResp('["happiness"]')
+_INSIGHTS_RESPONSE = LLMResp(
+    "Team happiness is declining while defect rates are increasing. "
+    "This suggests potential issues with team morale and code quality."
+)
+_STABLE_RESPONSE = LLMResp("Team happiness is stable.")
+_DOING_WELL_RESPONSE = LLMResp("Team is doing well!")
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_dashboard_client():
-    """Create a mock dashboard client."""
+    """Create a mock dashboard client shared by the module."""
     client = MagicMock()
     client.fetch_multiple_charts = AsyncMock(
         return_value={
@@ -23,21 +39,27 @@ def mock_dashboard_client():
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_llm():
-    """Create a mock LLM."""
+    """Create a mock LLM shared by the module."""
     llm = MagicMock()
+    llm.ainvoke = AsyncMock()
     return llm
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def agent(mock_dashboard_client, mock_llm):
-    """Create an agent instance for testing."""
-    with patch("src.analysis.langgraph_agent.get_dashboard_client") as mock_get_client:
-        mock_get_client.return_value = mock_dashboard_client
-        agent = DashboardAnalysisAgent(dashboard_client=mock_dashboard_client)
-        agent.llm = mock_llm
-        return agent
+    """Create one agent instance for the module."""
+    agent = DashboardAnalysisAgent(dashboard_client=mock_dashboard_client)
+    agent.llm = mock_llm
+    return agent
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_dashboard_client, mock_llm):
+    """Clear call history and canned replies left by the previous test."""
+    mock_llm.ainvoke.reset_mock(return_value=True, side_effect=True)
+    mock_dashboard_client.fetch_multiple_charts.reset_mock()
 
 
 class TestDashboardAnalysisAgent:
@@ -49,13 +71,11 @@ class TestDashboardAnalysisAgent:
         assert agent.llm is not None
         assert agent.graph is not None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
     async def test_analyze_query(self, agent, mock_llm):
         """Test query analysis step."""
         # Mock LLM response
-        mock_response = MagicMock()
-        mock_response.content = '["happiness", "defect-rate-all"]'
-        mock_llm.ainvoke = AsyncMock(return_value=mock_response)
+        mock_llm.ainvoke.return_value = _CHARTS_RESPONSE
 
         state: AgentState = {
             "messages": [],
@@ -70,7 +90,7 @@ class TestDashboardAnalysisAgent:
         assert "relevant_charts" in result_state["analysis_results"]
         assert isinstance(result_state["analysis_results"]["relevant_charts"], list)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
     async def test_fetch_data(self, agent, mock_dashboard_client):
         """Test data fetching step."""
         state: AgentState = {
@@ -87,7 +107,7 @@ class TestDashboardAnalysisAgent:
         assert "defect-rate-all" in result_state["chart_data"]
         mock_dashboard_client.fetch_multiple_charts.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
     async def test_analyze_data(self, agent):
         """Test data analysis step."""
         state: AgentState = {
@@ -106,15 +126,10 @@ class TestDashboardAnalysisAgent:
         assert "data_summary" in result_state["analysis_results"]
         assert "trends" in result_state["analysis_results"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
     async def test_generate_insights(self, agent, mock_llm):
         """Test insights generation step."""
-        mock_response = MagicMock()
-        mock_response.content = (
-            "Team happiness is declining while defect rates are increasing. "
-            "This suggests potential issues with team morale and code quality."
-        )
-        mock_llm.ainvoke = AsyncMock(return_value=mock_response)
+        mock_llm.ainvoke.return_value = _INSIGHTS_RESPONSE
 
         state: AgentState = {
             "messages": [],
@@ -135,19 +150,11 @@ class TestDashboardAnalysisAgent:
         assert result_state["response"] != ""
         assert "Team happiness" in result_state["response"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
     async def test_analyze_full_flow(self, agent, mock_llm, mock_dashboard_client):
         """Test full analysis flow."""
         # Mock LLM responses
-        mock_llm_response_query = MagicMock()
-        mock_llm_response_query.content = '["happiness"]'
-
-        mock_llm_response_insights = MagicMock()
-        mock_llm_response_insights.content = "Team happiness is stable."
-
-        mock_llm.ainvoke = AsyncMock(
-            side_effect=[mock_llm_response_query, mock_llm_response_insights]
-        )
+        mock_llm.ainvoke.side_effect = [_HAPPINESS_CHARTS_RESPONSE, _STABLE_RESPONSE]
 
         result = await agent.analyze("How is team happiness?")
 
@@ -156,30 +163,25 @@ class TestDashboardAnalysisAgent:
         assert "chart_data" in result
         assert "analysis" in result
 
-    @pytest.mark.asyncio
-    async def test_analyze_with_error(self, agent):
+    @pytest.mark.asyncio(scope="module")
+    async def test_analyze_with_error(self, agent, monkeypatch):
         """Test analysis with error handling."""
         # Force an error by setting graph to None
-        agent.graph = None
+        monkeypatch.setattr(agent, "graph", None)
 
         result = await agent.analyze("Test query")
 
         assert result["success"] is False
         assert "error" in result
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
     async def test_chat_interface(self, agent, mock_llm, mock_dashboard_client):
         """Test simple chat interface."""
         # Mock LLM responses
-        mock_llm_response_query = MagicMock()
-        mock_llm_response_query.content = '["happiness"]'
-
-        mock_llm_response_insights = MagicMock()
-        mock_llm_response_insights.content = "Team is doing well!"
-
-        mock_llm.ainvoke = AsyncMock(
-            side_effect=[mock_llm_response_query, mock_llm_response_insights]
-        )
+        mock_llm.ainvoke.side_effect = [
+            _HAPPINESS_CHARTS_RESPONSE,
+            _DOING_WELL_RESPONSE,
+        ]
 
         response = await agent.chat("How is the team?")
 
@@ -219,6 +221,28 @@ class TestDashboardAnalysisAgent:
         assert "Error" in formatted
 
 
+@pytest.mark.parametrize(
+    "content",
+    [
+        '["happiness", "defect-rate-all"]',
+        " [ ] ",
+        '\n["review-time"]\n',
+        '[{"chart": "happiness"}]',
+        '["a\\"b"]',
+    ],
+)
+def test_parse_chart_names_matches_json(content):
+    """Test the flat-list fast path agrees with json.loads."""
+    assert _parse_chart_names(content) == json.loads(content)
+
+
+@pytest.mark.parametrize("content", ["not json", '["a" "b"]', '["a",]'])
+def test_parse_chart_names_invalid(content):
+    """Test malformed replies still raise so the caller falls back."""
+    with pytest.raises(ValueError):
+        _parse_chart_names(content)
+
+
 def test_get_dashboard_agent_singleton():
     """Test that get_dashboard_agent returns the same instance."""
     agent1 = get_dashboard_agent()
@@ -3,26 +3,18 @@ Unit tests for metrics API client.
 """
 
 from datetime import datetime
-from unittest.mock import AsyncMock, Mock, patch
+from types import MappingProxyType
 
 import httpx
 import pytest
 
 from src.utils.metrics_client import MetricsAPIError, MetricsClient, get_metrics_client
 
+_START = datetime(2024, 1, 1)
+_END = datetime(2024, 1, 14, 23, 59, 59)
 
-@pytest.fixture
-def metrics_client():
-    """Create a test metrics client."""
-    return MetricsClient(
-        api_url="https://test-api.com", api_key="test-key-123", timeout=10
-    )
-
-
-@pytest.fixture
-def mock_sprint_data():
-    """Mock sprint data from API."""
-    return {
+_MOCK_SPRINT = MappingProxyType(
+    {
         "sprint_id": "SPRINT-2024-01",
         "sprint_name": "Sprint 24.01",
         "start_date": "2024-01-01T00:00:00",
@@ -31,6 +23,45 @@ def mock_sprint_data():
         "story_points_completed": 42,
         "review_time": 24.3,
     }
+)
+
+
+# Canned responses by URL path, and the requests the transport has seen
+_ROUTES = {}
+_REQUESTS = []
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Serve the canned response (or raise the error) for the request path."""
+    _REQUESTS.append(request)
+    result = _ROUTES[request.url.path]
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+@pytest.fixture(autouse=True)
+def _reset_routes():
+    """Clear canned responses and recorded requests between tests."""
+    _ROUTES.clear()
+    _REQUESTS.clear()
+
+
+@pytest.fixture(scope="module")
+def metrics_client():
+    """Create a test metrics client shared by the module."""
+    return MetricsClient(
+        api_url="https://test-api.com",
+        api_key="test-key-123",
+        timeout=10,
+        transport=httpx.MockTransport(_handler),
+    )
+
+
+@pytest.fixture
+def mock_sprint_data():
+    """Mock sprint data from API (read-only)."""
+    return _MOCK_SPRINT
 
 
 def test_metrics_client_initialization():
@@ -49,83 +80,61 @@ def test_metrics_client_default_settings():
     assert client.timeout == 30
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_fetch_sprints_success(metrics_client, mock_sprint_data):
     """Test successful fetch of sprints from API."""
-    mock_response = Mock()
-    mock_response.json.return_value = [mock_sprint_data]
-    mock_response.status_code = 200
-
-    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = mock_response
+    _ROUTES["/sprints"] = httpx.Response(200, json=[dict(mock_sprint_data)])
 
-        sprints = await metrics_client.fetch_sprints(count=1)
+    sprints = await metrics_client.fetch_sprints(count=1)
 
-        assert len(sprints) == 1
-        assert sprints[0]["sprint_id"] == "SPRINT-2024-01"
-        mock_get.assert_called_once()
+    assert len(sprints) == 1
+    assert sprints[0]["sprint_id"] == "SPRINT-2024-01"
+    assert len(_REQUESTS) == 1
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_fetch_sprints_with_team_id(metrics_client, mock_sprint_data):
     """Test fetching sprints with team_id parameter."""
-    mock_response = Mock()
-    mock_response.json.return_value = [mock_sprint_data]
-    mock_response.status_code = 200
-
-    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = mock_response
+    _ROUTES["/sprints"] = httpx.Response(200, json=[dict(mock_sprint_data)])
 
-        await metrics_client.fetch_sprints(count=5, team_id="TEAM-001")
+    await metrics_client.fetch_sprints(count=5, team_id="TEAM-001")
 
-        # Verify team_id was passed in params
-        call_kwargs = mock_get.call_args[1]
-        assert call_kwargs["params"]["team_id"] == "TEAM-001"
+    # Verify team_id was passed in params
+    assert _REQUESTS[0].url.params["team_id"] == "TEAM-001"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_fetch_sprints_http_error(metrics_client):
     """Test handling of HTTP error."""
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-        "Not found", request=Mock(), response=mock_response
-    )
-
-    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = mock_response
+    _ROUTES["/sprints"] = httpx.Response(404)
 
-        with pytest.raises(MetricsAPIError, match="API returned status 404"):
-            await metrics_client.fetch_sprints()
+    with pytest.raises(MetricsAPIError, match="API returned status 404"):
+        await metrics_client.fetch_sprints()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_fetch_sprints_connection_error(metrics_client):
     """Test handling of connection error."""
-    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-        mock_get.side_effect = httpx.RequestError("Connection failed")
+    _ROUTES["/sprints"] = httpx.ConnectError("Connection failed")
 
-        with pytest.raises(MetricsAPIError, match="Failed to connect to API"):
-            await metrics_client.fetch_sprints()
+    with pytest.raises(MetricsAPIError, match="Failed to connect to API"):
+        await metrics_client.fetch_sprints()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_fetch_sprint_metrics_success(metrics_client, mock_sprint_data):
     """Test fetching single sprint metrics."""
-    mock_response = Mock()
-    mock_response.json.return_value = mock_sprint_data
-    mock_response.status_code = 200
-
-    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = mock_response
+    _ROUTES["/sprints/SPRINT-2024-01"] = httpx.Response(
+        200, json=dict(mock_sprint_data)
+    )
 
-        metrics = await metrics_client.fetch_sprint_metrics("SPRINT-2024-01")
+    metrics = await metrics_client.fetch_sprint_metrics("SPRINT-2024-01")
 
-        assert metrics["sprint_id"] == "SPRINT-2024-01"
-        assert metrics["team_happiness"] == 7.5
+    assert metrics["sprint_id"] == "SPRINT-2024-01"
+    assert metrics["team_happiness"] == 7.5
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_fetch_sprint_metrics_mock_data():
     """Test fetching sprint metrics with mock data."""
     client = MetricsClient(api_url="", api_key="")
@@ -148,8 +157,47 @@ def test_validate_and_transform_with_string_dates(metrics_client):
 
     metrics = metrics_client.validate_and_transform(data)
 
-    assert isinstance(metrics.start_date, datetime)
-    assert isinstance(metrics.end_date, datetime)
+    assert metrics.start_date == _START
+    assert metrics.end_date == _END
+
+
+def test_validate_and_transform_cache_hit(metrics_client, mock_sprint_data):
+    """Test identical payloads reuse the cached result; changed ones revalidate."""
+    payload = dict(mock_sprint_data, story_point_distribution={"small": 5})
+    first = metrics_client.validate_and_transform(payload)
+    second = metrics_client.validate_and_transform(dict(payload))
+
+    # Each caller gets its own copy, so edits do not leak between them
+    assert second == first
+    assert second is not first
+    second.team_happiness = 1.0
+    second.story_point_distribution["small"] = 99
+    third = metrics_client.validate_and_transform(dict(payload))
+    assert third == first
+
+    changed = dict(mock_sprint_data, team_happiness=6.0)
+    fourth = metrics_client.validate_and_transform(changed)
+
+    assert fourth.team_happiness == 6.0
+    assert isinstance(changed["start_date"], str)  # input is not mutated
+
+
+def test_validate_and_transform_cache_evicts_oldest(mock_sprint_data, monkeypatch):
+    """Test the cache keeps only the most recently used sprints."""
+    monkeypatch.setattr("src.utils.metrics_client._VALIDATED_CACHE_SIZE", 2)
+    client = MetricsClient(api_url="https://test-api.com")
+
+    for sprint_id in ("SPRINT-1", "SPRINT-2", "SPRINT-1", "SPRINT-3"):
+        client.validate_and_transform(dict(mock_sprint_data, sprint_id=sprint_id))
+
+    assert list(client._validated_cache) == ["SPRINT-1", "SPRINT-3"]
+
+
+@pytest.mark.parametrize("raw_data", [{"sprint_id": ["SPRINT-1"]}, ["SPRINT-1"]])
+def test_validate_and_transform_bad_payload(metrics_client, raw_data):
+    """Test malformed payloads raise the documented ValueError."""
+    with pytest.raises(ValueError, match="Invalid metrics data"):
+        metrics_client.validate_and_transform(raw_data)
 
 
 def test_validate_and_transform_invalid_data(metrics_client):
@@ -170,21 +218,52 @@ def test_get_mock_data(metrics_client):
     assert len(mock_data) == 3
     assert mock_data[0]["sprint_id"] == "SPRINT-2024-01"
     assert mock_data[1]["sprint_id"] == "SPRINT-2024-02"
+    assert mock_data[0]["start_date"] == _START
+    assert mock_data[0]["end_date"] == _END
 
     # Verify trends in mock data
     assert mock_data[1]["team_happiness"] < mock_data[0]["team_happiness"]
     assert mock_data[1]["review_time"] > mock_data[0]["review_time"]
 
 
+def test_get_mock_data_beyond_one_year(metrics_client):
+    """Test mock data past the prebuilt year rolls dates into the next year."""
+    mock_data = metrics_client._get_mock_data(count=15)
+
+    assert len(mock_data) == 15
+    assert mock_data[:12] == metrics_client._get_mock_data(count=12)
+    assert mock_data[12]["sprint_id"] == "SPRINT-2024-13"
+    assert mock_data[12]["start_date"] == datetime(2025, 1, 1)
+    assert metrics_client.validate_and_transform(mock_data[14]).sprint_id == (
+        "SPRINT-2024-15"
+    )
+
+
 def test_get_mock_sprint_data(metrics_client):
     """Test mock sprint data generation."""
     mock_data = metrics_client._get_mock_sprint_data("SPRINT-2024-05")
 
     assert mock_data["sprint_id"] == "SPRINT-2024-05"
+    assert mock_data["start_date"] == datetime(2024, 5, 1)
     assert "team_happiness" in mock_data
     assert "review_time" in mock_data
 
 
+def test_mock_data_returns_fresh_copies(metrics_client):
+    """Test mutating returned mock sprints does not affect later calls."""
+    sprint = metrics_client._get_mock_data(count=1)[0]
+    sprint.pop("team_happiness")
+    sprint["story_point_distribution"]["small"] = 99
+
+    single = metrics_client._get_mock_sprint_data("SPRINT-2024-01")
+    single["sprint_name"] = "changed"
+
+    fresh = metrics_client._get_mock_data(count=1)[0]
+    assert fresh["team_happiness"] == 7.5
+    assert fresh["story_point_distribution"]["small"] == 5
+    assert metrics_client._get_mock_sprint_data("SPRINT-2024-01") == fresh
+
+
 def test_get_metrics_client_singleton():
     """Test global metrics client instance."""
     client1 = get_metrics_client()
@@ -2,12 +2,23 @@
 Unit tests for statistical analysis engine.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
+import numpy as np
+import pandas as pd
 import pytest
+from scipy import stats
 
-from src.analysis.statistical import StatisticalAnalyzer, get_statistical_analyzer
-from src.core.models import SprintMetrics
+from src.analysis.statistical import (
+    StatisticalAnalyzer,
+    _column_stats,
+    _pearson_p_values,
+    _zscore_outliers,
+    _zscore_outliers_loop,
+    _zscore_outliers_numpy,
+    get_statistical_analyzer,
+)
+from src.core.models import SprintMetrics, TrendAnalysis
 
 
 @pytest.fixture
@@ -100,11 +111,63 @@ def test_analyze_trends_stable_metric(analyzer):
 
     trends = analyzer.analyze_trends(sprints)
 
-    testing_trend = next((t for t in trends if t.metric_name == "testing_time"), None)
+    testing_trend = {t.metric_name: t for t in trends}.get("testing_time")
     if testing_trend:
         assert testing_trend.trend_direction == "stable"
 
 
+def test_analyze_trends_skips_missing_values(analyzer):
+    """Test metrics with gaps use their last two non-null values."""
+    review_times = [10.0, 12.0, None, 15.0]
+    sprints = [
+        SprintMetrics(
+            sprint_id=f"SPRINT-{i + 1}",
+            sprint_name=f"Sprint {i + 1}",
+            start_date=datetime(2024, i + 1, 1),
+            end_date=datetime(2024, i + 1, 14),
+            review_time=value,
+            coding_time=100.0 + i,
+        )
+        for i, value in enumerate(review_times)
+    ]
+
+    trend_dict = {t.metric_name: t for t in analyzer.analyze_trends(sprints)}
+
+    review_trend = trend_dict["review_time"]
+    assert review_trend.previous_value == 12.0
+    assert review_trend.current_value == 15.0
+    assert review_trend.change_percent == 25.0
+    assert review_trend.is_significant
+    assert trend_dict["coding_time"].previous_value == 102.0
+    assert trend_dict["coding_time"].significance_level == "p < 0.01"
+
+
+def test_analyze_trends_models_match_validation(analyzer, sample_sprints):
+    """Test trends built without validation equal validated models."""
+    trends = analyzer.analyze_trends(sample_sprints)
+
+    assert trends
+    for trend in trends:
+        validated = TrendAnalysis.model_validate(trend.model_dump())
+        assert validated == trend
+        assert type(validated.current_value) is type(trend.current_value)
+
+
+def test_analyze_trends_keeps_requested_order(analyzer, sample_sprints):
+    """Test trends are a plain list in the order metrics were requested."""
+    trends = analyzer.analyze_trends(
+        sample_sprints, ["review_time", "team_happiness", "review_time"]
+    )
+
+    assert type(trends) is list
+    assert [t.metric_name for t in trends] == [
+        "review_time",
+        "team_happiness",
+        "review_time",
+    ]
+    assert trends[2] is trends[0]
+
+
 def test_analyze_trends_insufficient_data(analyzer):
     """Test with insufficient data."""
     single_sprint = [
@@ -146,6 +209,39 @@ def test_analyze_correlations_specific_metrics(analyzer, sample_sprints):
     assert isinstance(correlations, list)
 
 
+def test_analyze_correlations_strong_pairs(analyzer, sample_sprints):
+    """Test linear metrics are reported as strong, with or without gaps."""
+    sample_sprints[1] = sample_sprints[1].model_copy(update={"coding_time": None})
+
+    correlations = analyzer.analyze_correlations(
+        sample_sprints,
+        metrics_to_analyze=["review_time", "coding_time", "team_happiness"],
+    )
+    pairs = {(c.metric_1, c.metric_2): c.correlation_coefficient for c in correlations}
+
+    assert pairs == {
+        ("review_time", "coding_time"): 1.0,
+        ("review_time", "team_happiness"): -1.0,
+        ("coding_time", "team_happiness"): -1.0,
+    }
+
+
+def test_screen_correlations_skips_constant_metrics(analyzer):
+    """Test constant metrics are screened out of every pair."""
+    columns = {
+        "review_time": np.array([1.0, 2.0, 3.0, 4.0]),
+        "testing_time": np.array([20.0, 20.0, 20.0, 20.0]),
+        "coding_time": np.array([2.0, 4.1, 5.9, 8.0]),
+    }
+
+    index, maybe_strong = analyzer._screen_correlations(columns, list(columns))
+
+    assert index == {"review_time": 0, "testing_time": 1, "coding_time": 2}
+    assert not maybe_strong[index["testing_time"]].any()
+    assert not maybe_strong[:, index["testing_time"]].any()
+    assert maybe_strong[index["review_time"], index["coding_time"]]
+
+
 def test_detect_anomalies_no_anomaly(analyzer):
     """Test anomaly detection with normal data."""
     sprints = []
@@ -189,6 +285,78 @@ def test_detect_anomalies_with_outlier(analyzer):
     assert any(abs(z) > 1.5 for _, _, z in anomalies)
 
 
+def test_detect_anomalies_reports_outlier_details(analyzer):
+    """Test anomalies report position among non-null values, value and z-score."""
+    values = [20.0, None, 21.0, 20.5, 100.0, 20.0]
+    sprints = [
+        SprintMetrics(
+            sprint_id=f"SPRINT-{i + 1}",
+            sprint_name=f"Sprint {i + 1}",
+            start_date=datetime(2024, i + 1, 1),
+            end_date=datetime(2024, i + 1, 14),
+            review_time=val,
+        )
+        for i, val in enumerate(values)
+    ]
+
+    anomalies = analyzer.detect_anomalies(sprints, "review_time", z_threshold=1.5)
+
+    assert len(anomalies) == 1
+    idx, value, z_score = anomalies[0]
+    assert (idx, value) == (3, 100.0)
+    assert z_score == pytest.approx(1.7887, abs=1e-4)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [20.0, 21.0, 20.5, 100.0, 20.0],
+        [7.5, 7.5, 7.5],
+        [1.0, 2.0, 3.0, 4.0],
+        [1e9 + 20.0, 1e9 + 21.0, 1e9 + 20.5, 1e9 + 100.0, 1e9 + 20.0],
+    ],
+)
+@pytest.mark.parametrize("kernel", [_zscore_outliers_loop, _zscore_outliers])
+def test_zscore_outlier_kernels_agree(values, kernel):
+    """Test the loop and dispatched (numba if installed) kernels match NumPy."""
+    array = np.array(values)
+
+    positions, z_scores = kernel(array, 1.0)
+    numpy_positions, numpy_z = _zscore_outliers_numpy(array, 1.0)
+
+    assert positions.tolist() == numpy_positions.tolist()
+    assert z_scores == pytest.approx(numpy_z)
+
+
+@pytest.mark.parametrize(
+    "kernel", [_zscore_outliers_loop, _zscore_outliers_numpy, _zscore_outliers]
+)
+def test_zscore_outlier_kernels_constant_input(kernel):
+    """Test constant values yield no outliers rather than dividing by zero."""
+    positions, z_scores = kernel(np.array([7.5, 7.5, 7.5]), 1.0)
+
+    assert positions.size == 0
+    assert z_scores.size == 0
+
+
+def test_column_stats_time_trend_matches_pearsonr():
+    """Test the fused column stats give pearsonr's time-trend p-values."""
+    values = np.array(
+        [[1.0, 5.0, 2.0], [2.0, 5.0, 8.0], [3.5, 5.0, 1.0], [4.0, 5.0, 9.0]]
+    )
+    time = np.arange(len(values))
+
+    column_stats = _column_stats(values)
+    p_values = _pearson_p_values(column_stats["r_time"], len(values))
+
+    assert column_stats["constant"].tolist() == [False, True, False]
+    assert np.isnan(p_values[1])
+    for column in (0, 2):
+        expected = stats.pearsonr(time, values[:, column])
+        assert column_stats["r_time"][column] == pytest.approx(expected[0])
+        assert p_values[column] == pytest.approx(expected[1])
+
+
 def test_calculate_moving_average(analyzer, sample_sprints):
     """Test moving average calculation."""
     ma = analyzer.calculate_moving_average(
@@ -201,6 +369,33 @@ def test_calculate_moving_average(analyzer, sample_sprints):
     assert all(isinstance(v, (float, type(None))) for v in ma)
 
 
+def test_calculate_moving_average_values(analyzer):
+    """Test partial leading windows, gaps and all-missing windows."""
+    values = [10.0, 20.0, None, None, 40.0]
+    sprints = [
+        SprintMetrics(
+            sprint_id=f"SPRINT-{i + 1}",
+            sprint_name=f"Sprint {i + 1}",
+            start_date=datetime(2024, i + 1, 1),
+            end_date=datetime(2024, i + 1, 14),
+            review_time=val,
+        )
+        for i, val in enumerate(values)
+    ]
+
+    ma = analyzer.calculate_moving_average(sprints, "review_time", window=2)
+
+    assert ma == [10.0, 15.0, 20.0, None, 40.0]
+    assert (
+        analyzer.calculate_moving_average(sprints, "review_time", window=np.int64(2))
+        == ma
+    )
+
+    for window in (0, 2.5):
+        with pytest.raises(ValueError):
+            analyzer.calculate_moving_average(sprints, "review_time", window=window)
+
+
 def test_analyze_story_point_distribution(analyzer, sample_sprints):
     """Test story point distribution analysis."""
     analysis = analyzer.analyze_story_point_distribution(sample_sprints)
@@ -239,6 +434,18 @@ def test_story_point_distribution_patterns(analyzer):
     assert analysis["large_percent"] > 40
 
 
+def test_story_point_distribution_all_zero(analyzer, sample_sprints):
+    """Test distributions that count no stories report no data."""
+    sprints = [
+        sprint.model_copy(update={"story_point_distribution": {"small": 0, "xl": 0}})
+        for sprint in sample_sprints
+    ]
+
+    analysis = analyzer.analyze_story_point_distribution(sprints)
+
+    assert analysis == {"pattern": "No distribution data available"}
+
+
 def test_sprints_to_dataframe(analyzer, sample_sprints):
     """Test conversion of sprints to DataFrame."""
     df = analyzer._sprints_to_dataframe(sample_sprints)
@@ -251,6 +458,35 @@ def test_sprints_to_dataframe(analyzer, sample_sprints):
     assert df["start_date"].dtype == "datetime64[ns]"
 
 
+def test_sprints_to_dataframe_keeps_timezones(analyzer, sample_sprints):
+    """Test timezone-aware dates keep their zone in the DataFrame."""
+    aware = [
+        sprint.model_copy(
+            update={"start_date": sprint.start_date.replace(tzinfo=timezone.utc)}
+        )
+        for sprint in sample_sprints
+    ]
+
+    df = analyzer._sprints_to_dataframe(aware)
+
+    assert str(df["start_date"].dt.tz) == "UTC"
+    assert df["end_date"].dtype == "datetime64[ns]"
+    assert df["start_date"].iloc[0] == pd.Timestamp(aware[0].start_date)
+
+
+def test_to_soa_reads_current_values(analyzer, sample_sprints):
+    """Test metric arrays reflect the sprints passed, skipping unknown metrics."""
+    columns = analyzer._to_soa(sample_sprints, ["review_time", "not_a_field"])
+
+    assert list(columns) == ["review_time"]
+
+    sample_sprints[0].review_time = 99.0
+    rebuilt = analyzer._to_soa(sample_sprints, ["review_time"])
+
+    assert rebuilt["review_time"][0] == 99.0
+    assert columns["review_time"][0] != 99.0
+
+
 def test_get_numeric_metrics(analyzer, sample_sprints):
     """Test extraction of numeric metrics."""
     df = analyzer._sprints_to_dataframe(sample_sprints)
@@ -260,6 +496,9 @@ def test_get_numeric_metrics(analyzer, sample_sprints):
     assert "review_time" in numeric_metrics
     assert "sprint_id" not in numeric_metrics  # Should be excluded
     assert "sprint_name" not in numeric_metrics  # Should be excluded
+    assert "story_point_distribution" not in numeric_metrics
+    # Numeric fields are listed even when no sprint reports them
+    assert "bugs_security" in numeric_metrics
 
 
 def test_correlation_interpretation(analyzer, sample_sprints):
@@ -306,7 +545,7 @@ def test_trend_significance_detection(analyzer):
     ]
 
     trends = analyzer.analyze_trends(sprints)
-    review_trend = next((t for t in trends if t.metric_name == "review_time"), None)
+    review_trend = {t.metric_name: t for t in trends}.get("review_time")
 
     assert review_trend is not None
     assert review_trend.is_significant